@@ -0,0 +1,107 @@
+"""
+미들웨어 마이크로 벤치마크.
+/api/v1/repositories/languages/search 엔드포인트 하나만 가진 앱을 만들어
+BaseHTTPMiddleware 기반(이전) 미들웨어와 순수 ASGI(현재) 미들웨어의 초당 처리 요청 수를 비교한다.
+네트워크 영향을 없애기 위해 httpx ASGITransport로 앱을 직접 호출하며, 로그 출력은 끈다.
+
+사용법: python benchmarks/middleware_benchmark.py [--requests 5000] [--concurrency 50]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Annotated
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.logger import logger
+from fastapi.params import Query
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+
+from common.config.middleware.ip_rate_limit_middleware import ENDPOINT_BLACK_LIST, IPRateLimitMiddleware
+from common.config.middleware.log_request_time_middleware import LogRequestTimeMiddleware
+from github.languages import afind_languages_list_by_query, aget_language_index
+from schema.repo_lanaguages_search_resp import RepoLanguagesSearchResp
+
+PATH = "/api/v1/repositories/languages/search"
+
+
+class BaseHTTPLogRequestTimeMiddleware(BaseHTTPMiddleware):
+    """비교용: 이전 BaseHTTPMiddleware 구현"""
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        logger.info(f"요청자: {request.client.host}:{request.client.port}")
+        start = time.perf_counter()
+        response = await call_next(request)
+        elapsed = time.perf_counter() - start
+        logger.info(f"[{request.method}] {request.url.path} - {elapsed:.4f}s")
+        return response
+
+
+class BaseHTTPIPRateLimitMiddleware(BaseHTTPMiddleware):
+    """비교용: 이전 BaseHTTPMiddleware 구현 (languages 검색은 제한 대상이 아니므로 통과 경로만 측정)"""
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if request.url.path not in ENDPOINT_BLACK_LIST:
+            return await call_next(request)
+        return await call_next(request)
+
+
+def build_app(log_middleware, rate_limit_middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get(PATH, response_model=RepoLanguagesSearchResp)
+    async def search_repository_languages_list(query: Annotated[str, Query(min_length=1)]):
+        return RepoLanguagesSearchResp(results=await afind_languages_list_by_query(query))
+
+    # app_setup.setup_common_middleware 와 같은 순서
+    app.add_middleware(rate_limit_middleware)
+    app.add_middleware(log_middleware)
+    return app
+
+
+async def run(app: FastAPI, total: int, concurrency: int) -> float:
+    """total개의 요청을 concurrency개씩 동시에 보내고 초당 처리 수를 반환"""
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+    queries = ["py", "java", "rust", "go", "script"]
+    remaining = iter(range(total))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            for i in remaining:
+                response = await client.get(PATH, params={"query": queries[i % len(queries)]})
+                response.raise_for_status()
+
+        # 워밍업
+        await client.get(PATH, params={"query": "py"})
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    await aget_language_index()
+
+    before = build_app(BaseHTTPLogRequestTimeMiddleware, BaseHTTPIPRateLimitMiddleware)
+    after = build_app(LogRequestTimeMiddleware, IPRateLimitMiddleware)
+
+    before_rps = await run(before, args.requests, args.concurrency)
+    after_rps = await run(after, args.requests, args.concurrency)
+
+    print(f"{PATH} ({args.requests} requests, concurrency {args.concurrency})")
+    print(f"  BaseHTTPMiddleware : {before_rps:>10.1f} req/s")
+    print(f"  pure ASGI          : {after_rps:>10.1f} req/s ({(after_rps / before_rps - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
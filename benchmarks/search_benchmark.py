@@ -0,0 +1,203 @@
+"""
+검색 파이프라인 오프라인 벤치마크.
+GitHub/OpenAI 대신 로컬 스텁 서버를, Pinecone 대신 프로세스 내부 numpy 스토어(가짜 임베딩)를 띄운 뒤
+실제 앱(main.app)의 /api/v1/repositories/search 와 /api/v1/repositories/languages/search 를
+동시성 단계별로 호출하고 전체/단계별(common.stage_timer) p50/p95/p99를 출력한다.
+각 스텁에는 지연 시간과 오류 비율을 주입할 수 있다.
+
+사용법: python benchmarks/search_benchmark.py [--requests 100] [--concurrency 1,10,50]
+        [--github-latency-ms 80] [--openai-latency-ms 300] [--embedding-latency-ms 30]
+        [--github-error-rate 0] [--openai-error-rate 0] [--max-p95-ms 0] [--ready-timeout 120]
+--max-p95-ms를 주면 search 전체 p95가 이를 넘을 때 종료 코드 1 (배포 전 회귀 확인용)
+앱 초기화가 실패하거나 --ready-timeout 초 안에 끝나지 않아도 종료 코드 1
+"""
+import argparse
+import asyncio
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx
+
+from benchmarks.stubs import Faults, StubServer, create_github_app, create_openai_app, create_qualifier_store
+
+SEARCH_PATH = "/api/v1/repositories/search"
+LANGUAGES_PATH = "/api/v1/repositories/languages/search"
+LANGUAGE_QUERIES = ["py", "java", "rust", "go", "script"]
+
+# 앱 모듈은 import 시점에 환경변수를 읽으므로 import 전에 설정한다
+# (외부 의존 없이 측정하기 위해 Redis 캐시를 끄고 numpy 스토어를 사용)
+BENCHMARK_ENV = {
+    "OPENAI_API_KEY": "benchmark",
+    "GIT_API_TOKEN": "benchmark",
+    "QUALIFIER_STORE": "numpy",
+    "EMBEDDING_CACHE_BACKEND": "none",
+    "SEARCH_CACHE_ENABLED": "false",
+    "SUMMARY_CACHE_ENABLED": "false",
+    "SEMANTIC_QUERY_CACHE_ENABLED": "false",
+    "GITHUB_ETAG_CACHE_ENABLED": "false",
+}
+
+
+class StageRecorder:
+    """stage_timer 관찰자. 단계별 소요 시간을 모은다."""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    def __call__(self, name: str, elapsed: float) -> None:
+        self.samples[name].append(elapsed)
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float) -> bool:
+    """/ready가 ready가 될 때까지 기다린다. 초기화 실패(failed)나 timeout 초과 시 오류를 출력하고 False"""
+    deadline = time.monotonic() + timeout
+    while True:
+        body = (await client.get("/ready")).json()
+        if body["status"] == "ready":
+            return True
+        if body["status"] == "failed":
+            print(f"!! 초기화 실패: {body.get('error')} (steps={body.get('steps')})")
+            return False
+        if time.monotonic() > deadline:
+            print(f"!! {timeout:g}초 안에 초기화가 끝나지 않음 (status={body['status']}, steps={body.get('steps')})")
+            return False
+        await asyncio.sleep(0.1)
+
+
+async def run_level(client: httpx.AsyncClient, path: str, total: int, concurrency: int, level: int):
+    """total개의 요청을 concurrency개씩 동시에 보내고 (요청별 소요 시간, 상태 코드 수, 처리량)을 반환"""
+    latencies: list[float] = []
+    statuses: Counter[int | str] = Counter()
+    remaining = iter(range(total))
+
+    async def send(i: int) -> httpx.Response:
+        if path == SEARCH_PATH:
+            # 검색어를 매번 바꿔 single-flight/캐시 효과 없이 전체 파이프라인을 측정
+            return await client.post(path, json={"keyword": f"benchmark {level}-{i}", "languages": []})
+        return await client.get(path, params={"query": LANGUAGE_QUERIES[i % len(LANGUAGE_QUERIES)]})
+
+    async def worker():
+        for i in remaining:
+            start = time.perf_counter()
+            try:
+                response = await send(i)
+                statuses[response.status_code] += 1
+            except Exception as e:
+                statuses[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, statuses, total / (time.perf_counter() - start)
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def print_report(title: str, rows: dict[str, list[float]], statuses: Counter, throughput: float) -> None:
+    print(f"\n== {title} ==")
+    print(f"  {'stage':<24}{'count':>7}{'p50(ms)':>11}{'p95(ms)':>11}{'p99(ms)':>11}")
+    for name, values in rows.items():
+        values = sorted(values)
+        print(
+            f"  {name:<24}{len(values):>7}"
+            f"{percentile(values, 50) * 1000:>11.1f}{percentile(values, 95) * 1000:>11.1f}"
+            f"{percentile(values, 99) * 1000:>11.1f}"
+        )
+    print(f"  status: {dict(statuses)}, throughput: {throughput:.1f} req/s")
+
+
+async def run(args) -> int:
+    # 환경변수 설정 이후에 앱 import
+    import main
+    from common.config import resources
+    from common.config.middleware import ip_rate_limit_middleware
+    from common.config.middleware.sliding_window_rate_limiter import SlidingWindowRateLimiter
+    from common.stage_timer import add_stage_observer, remove_stage_observer
+    from fastapi.logger import logger
+
+    logger.setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    # IP 레이트 리밋은 측정 대상이 아니므로 한도를 없앤다
+    ip_rate_limit_middleware.rate_limiter = SlidingWindowRateLimiter(limit=10 ** 9, window_seconds=1)
+
+    # Pinecone 대신 프로세스 내부 스토어 (임베딩 지연/오류 주입)
+    embedding_faults = Faults(args.embedding_latency_ms, args.jitter_ms, args.embedding_error_rate)
+    store = create_qualifier_store(embedding_faults, Path(tempfile.mkdtemp(prefix="qualifier_store_")))
+    resources.get_qualifier_store = lambda: store
+
+    exit_code = 0
+    transport = httpx.ASGITransport(app=main.app, client=("127.0.0.1", 50000))
+    async with main.app.router.lifespan_context(main.app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            # 초기화(언어 인덱스, 스토어, 체인) 완료 대기
+            if not await wait_ready(client, args.ready_timeout):
+                return 1
+
+            for path in args.endpoints:
+                for level in args.concurrency:
+                    recorder = StageRecorder()
+                    add_stage_observer(recorder)
+                    try:
+                        latencies, statuses, throughput = await run_level(
+                            client, path, args.requests, level, level
+                        )
+                    finally:
+                        remove_stage_observer(recorder)
+
+                    rows = {"total (http)": latencies, **recorder.samples}
+                    print_report(f"{path} (concurrency={level}, requests={args.requests})", rows, statuses, throughput)
+
+                    p95 = percentile(sorted(latencies), 95) * 1000
+                    if path == SEARCH_PATH and args.max_p95_ms and p95 > args.max_p95_ms:
+                        print(f"  !! p95 {p95:.1f}ms > 기준 {args.max_p95_ms:.1f}ms")
+                        exit_code = 1
+
+    return exit_code
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=lambda v: [int(c) for c in v.split(",")], default=[1, 10, 50])
+    parser.add_argument("--endpoints", type=lambda v: v.split(","), default=[SEARCH_PATH, LANGUAGES_PATH])
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--github-latency-ms", type=float, default=80.0)
+    parser.add_argument("--github-error-rate", type=float, default=0.0)
+    parser.add_argument("--openai-latency-ms", type=float, default=300.0)
+    parser.add_argument("--openai-error-rate", type=float, default=0.0)
+    parser.add_argument("--embedding-latency-ms", type=float, default=30.0)
+    parser.add_argument("--embedding-error-rate", type=float, default=0.0)
+    parser.add_argument("--max-p95-ms", type=float, default=0.0)
+    parser.add_argument("--ready-timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    github_faults = Faults(args.github_latency_ms, args.jitter_ms, args.github_error_rate)
+    openai_faults = Faults(args.openai_latency_ms, args.jitter_ms, args.openai_error_rate)
+
+    with StubServer(create_github_app(github_faults)) as github, StubServer(create_openai_app(openai_faults)) as openai:
+        os.environ.update(BENCHMARK_ENV)
+        os.environ.update({
+            "GITHUB_API_URL": github.url,
+            "GITHUB_GRAPHQL_URL": f"{github.url}/graphql",
+            "OPENAI_BASE_URL": f"{openai.url}/v1",
+        })
+        return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
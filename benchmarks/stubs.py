@@ -0,0 +1,257 @@
+"""
+벤치마크용 로컬 대역(stub).
+- GitHub REST/GraphQL 스텁 서버 (검색, 언어 조회, linguist YAML, GraphQL 언어 일괄 조회)
+- OpenAI 호환 스텁 서버 (chat/completions, embeddings)
+- 프로세스 내부 numpy 벡터 스토어 + 가짜 임베딩
+모두 지연 시간(평균 ± 지터)과 오류 비율을 주입할 수 있다.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import re
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LINGUIST_PATH = PROJECT_ROOT / "github" / "data" / "linguist_languages.yml"
+LANGUAGES = ["Python", "TypeScript", "Go", "Rust", "Java", "Shell", "Dockerfile"]
+QUALIFIER_TOPICS = ["stars", "language", "topic", "pushed", "created", "size", "followers", "license"]
+EMBEDDING_SIZE = 256
+
+
+@dataclass
+class Faults:
+    """지연 시간/오류 주입 설정"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    def delay(self) -> float:
+        return max(0.0, random.gauss(self.latency_ms, self.jitter_ms)) / 1000
+
+    def should_fail(self) -> bool:
+        return random.random() < self.error_rate
+
+
+def _error_response() -> JSONResponse:
+    return JSONResponse(status_code=500, content={"message": "injected error", "error": {"message": "injected error"}})
+
+
+# ---------------------------------------------------------------- GitHub
+
+def create_github_app(faults: Faults) -> FastAPI:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        await asyncio.sleep(faults.delay())
+        if faults.should_fail():
+            return _error_response()
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = "5000"
+        response.headers["X-RateLimit-Remaining"] = "4999"
+        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 3600)
+        return response
+
+    @app.get("/search/repositories")
+    async def search_repositories(request: Request, q: str, per_page: int = 30):
+        seed = hashlib.sha256(q.encode("utf-8")).hexdigest()[:8]
+        base_url = str(request.base_url).rstrip("/")
+        items = []
+        for i in range(per_page):
+            name = f"repo-{seed}-{i}"
+            items.append({
+                "name": name,
+                "full_name": f"bench/{name}",
+                "description": f"Benchmark repository {i} for {q}",
+                "topics": ["benchmark", "stub"],
+                "pushed_at": "2025-01-01T00:00:00Z",
+                "html_url": f"https://github.com/bench/{name}",
+                "stargazers_count": 1000 - i,
+                "languages_url": f"{base_url}/repos/bench/{name}/languages",
+            })
+        return {"total_count": per_page, "incomplete_results": False, "items": items}
+
+    @app.get("/repos/github-linguist/linguist/contents/lib/linguist/languages.yml")
+    async def linguist_languages():
+        content = base64.b64encode(LINGUIST_PATH.read_bytes()).decode("ascii")
+        return {"encoding": "base64", "content": content}
+
+    @app.get("/repos/{owner}/{name}/languages")
+    async def repository_languages(owner: str, name: str):
+        return _language_bytes(f"{owner}/{name}")
+
+    @app.post("/graphql")
+    async def graphql(request: Request):
+        variables = (await request.json()).get("variables", {})
+        data = {}
+        i = 0
+        while f"o{i}" in variables:
+            languages = _language_bytes(f"{variables[f'o{i}']}/{variables[f'n{i}']}")
+            data[f"r{i}"] = {
+                "languages": {"edges": [{"size": size, "node": {"name": name}} for name, size in languages.items()]}
+            }
+            i += 1
+        return {"data": data}
+
+    return app
+
+
+def _language_bytes(full_name: str) -> dict[str, int]:
+    rng = random.Random(full_name)
+    return {name: rng.randint(1_000, 100_000) for name in rng.sample(LANGUAGES, 3)}
+
+
+# ---------------------------------------------------------------- OpenAI
+
+def create_openai_app(faults: Faults) -> FastAPI:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        await asyncio.sleep(faults.delay())
+        if faults.should_fail():
+            return _error_response()
+        return await call_next(request)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        prompt = "\n".join(str(message.get("content", "")) for message in body.get("messages", []))
+        content = _chat_content(prompt, body.get("response_format"))
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(content) // 4
+        return {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content, "refusal": None},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        size = body.get("dimensions") or EMBEDDING_SIZE
+        fake = DeterministicFakeEmbedding(size=size)
+        return {
+            "object": "list",
+            "model": body.get("model", "stub"),
+            "data": [
+                {"object": "embedding", "index": i, "embedding": fake.embed_query(str(text))}
+                for i, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+        }
+
+    return app
+
+
+def _chat_content(prompt: str, response_format: dict | None) -> str:
+    """구조화 출력(json_schema)이면 스키마 이름에 맞는 JSON, 아니면 검색 쿼리 문자열"""
+    schema_name = ((response_format or {}).get("json_schema") or {}).get("name")
+    summary = ["벤치마크용 요약 1", "벤치마크용 요약 2", "벤치마크용 요약 3"]
+    if schema_name == "SummaryList":
+        return json.dumps({"summaries": summary}, ensure_ascii=False)
+    if schema_name == "BatchSummaryList":
+        # 리포지토리 메타데이터마다 description 키가 하나씩 있다
+        count = len(re.findall(r"['\"]description['\"]\s*:", prompt))
+        return json.dumps({"summaries": [summary] * count}, ensure_ascii=False)
+    return "benchmark stars:>100"
+
+
+# ---------------------------------------------------------------- 벡터 스토어
+
+class FaultyEmbeddings(Embeddings):
+    """가짜 임베딩에 지연 시간/오류를 주입하는 래퍼"""
+
+    def __init__(self, underlying: Embeddings, faults: Faults):
+        self.underlying = underlying
+        self.faults = faults
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.underlying.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        time.sleep(self.faults.delay())
+        if self.faults.should_fail():
+            raise RuntimeError("injected embedding error")
+        return self.underlying.embed_query(text)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        await asyncio.sleep(self.faults.delay())
+        if self.faults.should_fail():
+            raise RuntimeError("injected embedding error")
+        return self.underlying.embed_query(text)
+
+
+def create_qualifier_store(faults: Faults, snapshot_dir: Path):
+    """
+    GitHub 문서 대신 고정된 검색 한정자 문서를 쓰는 프로세스 내부 numpy 스토어.
+    (앱 모듈은 환경변수를 import 시점에 읽으므로, 벤치마크가 환경변수를 설정한 뒤 import 한다)
+    """
+    from langchain.vector_store.numpy_github_search_qualifier_store import NumpyGithubSearchQualifierStore
+
+    class BenchmarkQualifierStore(NumpyGithubSearchQualifierStore):
+        @staticmethod
+        def _load_search_docs():
+            return [
+                Document(page_content=f"## Search by {topic}\nUse the {topic} qualifier.", metadata={"Topic": topic})
+                for topic in QUALIFIER_TOPICS
+            ]
+
+    embedding = FaultyEmbeddings(DeterministicFakeEmbedding(size=EMBEDDING_SIZE), faults)
+    return BenchmarkQualifierStore(embedding=embedding, snapshot_dir=snapshot_dir)
+
+
+# ---------------------------------------------------------------- 서버 실행
+
+class StubServer:
+    """스텁 앱을 별도 스레드의 uvicorn 서버로 띄운다. (with 블록 동안 실행)"""
+
+    def __init__(self, app: FastAPI):
+        self.port = _free_port()
+        config = uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,67 @@
+"""
+이벤트 루프 지연(lag) 모니터. (디버그용, EVENT_LOOP_MONITOR_ENABLED=true 일 때만 동작)
+- asyncio 디버그 모드의 slow_callback_duration으로, THRESHOLD보다 오래 루프를 막은 콜백을 asyncio 로거로 남긴다.
+- 주기적으로 sleep 하는 하트비트 태스크로, 예정보다 늦게 깨어난 시간(=루프가 막힌 시간)을 측정해 로그를 남긴다.
+"""
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+
+from fastapi.logger import logger
+
+# ---- 이벤트 루프 모니터 설정 (환경변수로 조정 가능) ----
+ENABLED: bool = os.getenv("EVENT_LOOP_MONITOR_ENABLED", "false").lower() == "true"
+THRESHOLD: float = int(os.getenv("EVENT_LOOP_LAG_THRESHOLD_MS", "100")) / 1000  # 이보다 오래 막히면 로그
+INTERVAL: float = 0.5  # 하트비트 주기(초)
+
+
+@dataclass
+class EventLoopLagStats:
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    slow_ticks: int = 0  # THRESHOLD를 넘은 횟수
+
+
+stats = EventLoopLagStats()
+
+_task: asyncio.Task | None = None
+
+
+def start() -> None:
+    """lifespan startup에서 호출."""
+    global _task
+    if not ENABLED or _task is not None:
+        return
+
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = THRESHOLD
+    _task = asyncio.create_task(_amonitor())
+    logger.info(f"이벤트 루프 지연 모니터 시작 (기준 {THRESHOLD * 1000:.0f}ms)")
+
+
+async def astop() -> None:
+    """lifespan shutdown에서 호출."""
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
+
+
+async def _amonitor() -> None:
+    while True:
+        expected = time.perf_counter() + INTERVAL
+        await asyncio.sleep(INTERVAL)
+        lag = max(0.0, time.perf_counter() - expected)
+
+        stats.last_lag_seconds = lag
+        stats.max_lag_seconds = max(stats.max_lag_seconds, lag)
+        if lag > THRESHOLD:
+            stats.slow_ticks += 1
+            logger.warning(f"이벤트 루프가 {lag * 1000:.1f}ms 동안 막혔습니다")
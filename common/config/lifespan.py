@@ -2,12 +2,25 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from common.config import event_loop_monitor, resources
+from common.config.redis_client import close_async_redis_client
+from github.http_client import start_github_client, close_github_client
+from langchain.llm_registry import aclose_llm_clients
 from langchain.vector_store import refresh_documents_scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # startup
+    event_loop_monitor.start()  # EVENT_LOOP_MONITOR_ENABLED=true 일 때만
+    await start_github_client()
+    # 벡터 스토어/체인 등 무거운 객체는 백그라운드에서 초기화 (준비 상태는 /ready 로 확인)
+    resources.start_initialization()
     refresh_documents_scheduler.start_scheduler()
     yield
     # shutdown
+    await resources.ashutdown()
+    await close_github_client()
+    await aclose_llm_clients()
+    await close_async_redis_client()
+    await event_loop_monitor.astop()
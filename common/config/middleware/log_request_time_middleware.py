@@ -1,23 +1,33 @@
 import time
 
-from fastapi import Request
 from fastapi.logger import logger
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
+class LogRequestTimeMiddleware:
+    """
+    API 요청 시간 로거 미들웨어.
+    BaseHTTPMiddleware 대신 순수 ASGI로 구현하여 요청마다 추가 태스크/스트림 래핑이 생기지 않고,
+    스트리밍 응답도 그대로 통과시킨다.
+    소요 시간은 응답 헤더가 전송되는 시점(call_next 반환 시점과 동일)까지로 측정한다.
+    """
 
-class LogRequestTimeMiddleware(BaseHTTPMiddleware):
-    """ API 요청 시간 로거 미들웨어"""
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        logger.info(f"요청자: {request.client.host}:{request.client.port}")
-        start = time.perf_counter()
-        response = await call_next(request)
-        elapsed = time.perf_counter() - start
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        path = request.url.path
-        method = request.method
+        host, port = scope.get("client") or ("unknown", 0)
+        logger.info(f"요청자: {host}:{port}")
+        start = time.perf_counter()
 
-        logger.info(f"[{method}] {path} - {elapsed:.4f}s")
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - start
+                logger.info(f"[{scope['method']}] {scope['path']} - {elapsed:.4f}s")
+            await send(message)
 
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send_wrapper)
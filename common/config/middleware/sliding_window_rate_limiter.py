@@ -0,0 +1,94 @@
+import time
+import uuid
+from collections import OrderedDict, deque
+
+from fastapi.logger import logger
+
+from common.config.redis_client import get_async_redis_client
+
+REDIS_RETRY_INTERVAL: float = 5.0  # Redis 장애 감지 후 다시 시도하기까지 대기(초)
+
+# 슬라이딩 윈도우 검사 + 기록을 한 번의 왕복으로 원자적으로 처리하는 Lua 스크립트
+# - KEYS[1]: 카운터 키 (sorted set, score = 요청 시각 ms)
+# - ARGV[1]: 윈도우 길이(ms), ARGV[2]: 허용 요청 수, ARGV[3]: 이번 요청 고유 값
+# - 반환: {허용 여부(1/0), 윈도우 내 요청 수}
+SLIDING_WINDOW_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count >= limit then
+    return {0, count}
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, count + 1}
+"""
+
+
+class SlidingWindowRateLimiter:
+    """
+    Redis 슬라이딩 윈도우 레이트 리미터.
+    asyncio Redis 클라이언트로 이벤트 루프를 막지 않고, Lua 스크립트로 검사/기록을 원자적으로 처리한다.
+    Redis에 연결할 수 없으면 프로세스 내부 윈도우(최대 fallback_max_keys개 키, LRU)로 대신 제한한다.
+    """
+
+    def __init__(self, limit: int, window_seconds: int, fallback_max_keys: int = 10000):
+        self._limit = limit
+        self._window_ms = window_seconds * 1000
+        self._fallback_max_keys = fallback_max_keys
+        self._fallback: OrderedDict[str, deque[float]] = OrderedDict()
+        self._script = None
+        self._redis_retry_at = 0.0  # Redis 장애 시 이 시각까지는 Redis를 건너뛴다
+        self.rejected = 0  # 제한 초과로 거절한 요청 수
+
+    async def ais_allowed(self, key: str) -> bool:
+        allowed = await self._ais_allowed(key)
+        if not allowed:
+            self.rejected += 1
+        return allowed
+
+    async def _ais_allowed(self, key: str) -> bool:
+        if time.monotonic() < self._redis_retry_at:
+            return self._local_is_allowed(key)
+
+        try:
+            return await self._aredis_is_allowed(key)
+        except Exception as e:
+            logger.error(f"Rate limiter error, {REDIS_RETRY_INTERVAL}초 동안 로컬 제한으로 대체: {e}")
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+            return self._local_is_allowed(key)
+
+    async def _aredis_is_allowed(self, key: str) -> bool:
+        if self._script is None:
+            # EVALSHA 사용, 스크립트 캐시가 비면 자동으로 다시 로드
+            self._script = get_async_redis_client().register_script(SLIDING_WINDOW_SCRIPT)
+
+        allowed, _ = await self._script(keys=[key], args=[self._window_ms, self._limit, uuid.uuid4().hex])
+        return allowed == 1
+
+    def _local_is_allowed(self, key: str) -> bool:
+        now_ms = time.time() * 1000
+
+        timestamps = self._fallback.get(key)
+        if timestamps is None:
+            timestamps = deque()
+            self._fallback[key] = timestamps
+        self._fallback.move_to_end(key)
+
+        # 오래 요청이 없던 키부터 제거하여 메모리 사용량 제한
+        while len(self._fallback) > self._fallback_max_keys:
+            self._fallback.popitem(last=False)
+
+        while timestamps and timestamps[0] <= now_ms - self._window_ms:
+            timestamps.popleft()
+
+        if len(timestamps) >= self._limit:
+            return False
+
+        timestamps.append(now_ms)
+        return True
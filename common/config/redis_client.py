@@ -1,11 +1,48 @@
 import os
 
 import redis
+import redis.asyncio as aioredis
+
+# asyncio 클라이언트 커넥션 풀/타임아웃 설정 (Redis 장애 시 요청이 오래 묶이지 않도록)
+MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1.0"))
+
+_client: redis.Redis | None = None
+_async_client: aioredis.Redis | None = None
 
 
 def get_redis_client() -> redis.Redis:
     """
     전역에서 공유해서 쓰는 Redis 클라이언트.
+    처음 사용할 때 한 번만 생성한다.
+    """
+    global _client
+    if _client is None:
+        redis_url = os.getenv("REDIS_URL")
+        _client = redis.Redis.from_url(redis_url)
+    return _client
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """
+    전역에서 공유해서 쓰는 asyncio Redis 클라이언트.
+    내부 커넥션 풀을 재사용하므로 이벤트 루프를 막지 않는다.
     """
-    redis_url = os.getenv("REDIS_URL")
-    return redis.Redis.from_url(redis_url)
\ No newline at end of file
+    global _async_client
+    if _async_client is None:
+        redis_url = os.getenv("REDIS_URL")
+        _async_client = aioredis.Redis.from_url(
+            redis_url,
+            max_connections=MAX_CONNECTIONS,
+            socket_timeout=SOCKET_TIMEOUT,
+            socket_connect_timeout=SOCKET_TIMEOUT,
+        )
+    return _async_client
+
+
+async def close_async_redis_client() -> None:
+    """lifespan shutdown에서 호출하여 커넥션 풀을 정리한다."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
@@ -0,0 +1,120 @@
+"""
+앱 전역에서 한 번만 만들어 공유하는 무거운 객체(벡터 스토어, 쿼리 체인 등).
+import 시점이 아니라 lifespan에서 백그라운드로 초기화하여 서버가 바로 뜨도록 하고,
+초기화가 끝났는지는 /ready 엔드포인트로 확인한다.
+"""
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from fastapi.logger import logger
+
+from common.exceptions import ServiceNotReadyError
+from github.languages import aget_language_index
+from langchain.vector_store.qualifier_store_factory import get_qualifier_store
+
+if TYPE_CHECKING:
+    from langchain.chain.github_search_query_chain import GithubSearchQueryChain
+    from langchain.chain.simple_github_repository_summary_chain import SimpleGithubRepositorySummaryChain
+
+_query_chain: "GithubSearchQueryChain | None" = None
+_summary_chain: "SimpleGithubRepositorySummaryChain | None" = None
+_init_task: asyncio.Task | None = None
+_init_error: str | None = None
+_init_steps: dict[str, float] = {}  # 초기화 단계별 소요 시간(초)
+
+
+def start_initialization() -> None:
+    """
+    lifespan startup에서 호출. 초기화를 백그라운드 태스크로 시작한다.
+    이전 초기화가 실패한 경우에는 다시 시도한다.
+    """
+    global _init_task, _init_error
+    if _init_task is None or (_init_task.done() and _query_chain is None):
+        _init_error = None
+        _init_task = asyncio.create_task(_ainitialize())
+
+
+async def ashutdown() -> None:
+    """lifespan shutdown에서 호출. 진행 중인 초기화를 취소한다."""
+    global _init_task
+    if _init_task is not None and not _init_task.done():
+        _init_task.cancel()
+    _init_task = None
+
+
+def readiness() -> tuple[str, dict[str, float], str | None]:
+    """(상태, 단계별 소요 시간, 오류) 상태: initializing | ready | failed"""
+    if _query_chain is not None:
+        return "ready", dict(_init_steps), None
+    if _init_error is not None:
+        return "failed", dict(_init_steps), _init_error
+    return "initializing", dict(_init_steps), None
+
+
+async def aget_query_chain() -> "GithubSearchQueryChain":
+    """
+    공유 쿼리 체인을 반환한다.
+    초기화 중이면 끝날 때까지 기다리고, 실패했으면 ServiceNotReadyError.
+    (lifespan 밖에서 호출되면 그 자리에서 초기화를 시작한다)
+    """
+    if _query_chain is not None:
+        return _query_chain
+
+    start_initialization()
+    await asyncio.shield(_init_task)
+
+    if _query_chain is None:
+        raise ServiceNotReadyError("서버가 아직 준비되지 않았습니다. 잠시 후 다시 시도해주세요.")
+    return _query_chain
+
+
+def get_summary_chain() -> "SimpleGithubRepositorySummaryChain":
+    """공유 요약 체인. 검색 요청마다 새로 만들지 않도록 처음 사용할 때 한 번만 생성한다."""
+    global _summary_chain
+    if _summary_chain is None:
+        from langchain.chain.simple_github_repository_summary_chain import SimpleGithubRepositorySummaryChain
+        _summary_chain = SimpleGithubRepositorySummaryChain()
+    return _summary_chain
+
+
+async def _ainitialize() -> None:
+    global _query_chain, _init_error
+
+    try:
+        # 1) 언어 인덱스 (YAML 파싱)
+        await _atimed("language_index", aget_language_index())
+
+        # 2) 벡터 스토어 (외부 API 호출/문서 임베딩이 있을 수 있어 스레드에서 실행)
+        store = await _atimed("qualifier_store", asyncio.to_thread(get_qualifier_store))
+
+        # 3) 쿼리 체인 (LLM SDK import + 클라이언트 생성)
+        _query_chain = await _atimed("query_chain", asyncio.to_thread(_build_query_chain, store))
+
+        # 4) 요약 체인 (공유 LLM 클라이언트 사용)
+        await _atimed("summary_chain", asyncio.to_thread(get_summary_chain))
+
+        logger.info(f"리소스 초기화 완료: {_format_steps()}")
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        _init_error = str(e)
+        logger.error(f"리소스 초기화 실패: {e} ({_format_steps()})")
+
+
+def _build_query_chain(store):
+    # LLM SDK import 비용이 커서 서버 시작 경로가 아닌 백그라운드 초기화에서 import 한다
+    from langchain.chain.github_search_query_chain import GithubSearchQueryChain
+    return GithubSearchQueryChain(store)
+
+
+async def _atimed(name: str, awaitable):
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        _init_steps[name] = round(time.perf_counter() - start, 4)
+
+
+def _format_steps() -> str:
+    return ", ".join(f"{name}={elapsed:.4f}s" for name, elapsed in _init_steps.items())
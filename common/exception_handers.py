@@ -2,7 +2,7 @@ from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from starlette.responses import JSONResponse
 
-from common.exceptions import ClientError, ServerError
+from common.exceptions import ClientError, GithubRateLimitError, ServerError, ServiceNotReadyError
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -13,6 +13,14 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": str(exc)},
         )
 
+    @app.exception_handler(ServiceNotReadyError)
+    @app.exception_handler(GithubRateLimitError)
+    async def service_unavailable_handler(request: Request, exc: ServerError):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": str(exc)},
+        )
+
     @app.exception_handler(ServerError)
     async def server_error_handler(request: Request, exc: ServerError):
         return JSONResponse(
@@ -7,8 +7,20 @@ class ClientError(RepoInsightError):
 class ServerError(RepoInsightError):
     """서버/외부 서비스 문제(500대)에 해당하는 예외"""
 
+class ServiceNotReadyError(ServerError):
+    """서버 초기화(벡터 스토어, 체인 등)가 끝나지 않았거나 실패했을 때 (503)"""
+
 class UnsupportedLanguageError(ClientError):
     """지원하지 않는 언어를 요청했을 때"""
 
 class LinguistFetchError(ServerError):
-    """GitHub linguist YAML을 못 가져오거나 파싱 실패했을 때"""
\ No newline at end of file
+    """GitHub linguist YAML을 못 가져오거나 파싱 실패했을 때"""
+
+class GithubGraphQLError(ServerError):
+    """GitHub GraphQL API 응답에 데이터가 없거나 오류만 있을 때"""
+
+class GithubRateLimitError(ServerError):
+    """모든 GitHub 토큰의 rate limit 한도가 소진되어 대기 한도 안에 회복되지 않을 때 (503)"""
+
+class SingleFlightLeaderError(ServerError):
+    """다른 워커가 대신 처리하던 같은 요청(single-flight)이 실패했을 때"""
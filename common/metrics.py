@@ -0,0 +1,134 @@
+"""
+Prometheus 메트릭 (/metrics).
+- 단계별 소요 시간 히스토그램: common.stage_timer 관찰자로 수집한다.
+- 캐시/업스트림 오류/레이트 리밋 카운터, GitHub 한도/LLM 대기열 게이지:
+  각 모듈이 이미 집계하는 stats를 스크레이프 시점에 읽는다. (요청 경로에 추가 비용 없음)
+"""
+from typing import Iterator
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+from common.config import event_loop_monitor
+from common.config.middleware import ip_rate_limit_middleware
+from common.stage_timer import add_stage_observer
+from github import conditional_cache
+from github.rate_limit_scheduler import get_scheduler
+from langchain import language_detector, llm_governor, semantic_query_cache
+from langchain.embedding import cached_embeddings
+from service import search_result_cache, single_flight, summary_cache
+
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+stage_duration = Histogram(
+    "repoinsight_stage_duration_seconds",
+    "검색 파이프라인 단계별 소요 시간",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+
+
+def _observe_stage(name: str, elapsed: float) -> None:
+    stage_duration.labels(name).observe(elapsed)
+
+
+class _StatsCollector(Collector):
+    """모듈별 stats를 Prometheus 메트릭으로 변환"""
+
+    def collect(self) -> Iterator[Metric]:
+        cache = CounterMetricFamily("repoinsight_cache_requests", "캐시 조회 결과별 횟수", labels=["cache", "result"])
+        for result, value in (
+            ("hit", search_result_cache.stats.hits),
+            ("stale", search_result_cache.stats.stale_hits),
+            ("miss", search_result_cache.stats.misses),
+        ):
+            cache.add_metric(["search_result", result], value)
+        for result, value in (
+            ("local_hit", summary_cache.stats.local_hits),
+            ("redis_hit", summary_cache.stats.redis_hits),
+            ("miss", summary_cache.stats.misses),
+        ):
+            cache.add_metric(["summary", result], value)
+        cache.add_metric(["query_embedding", "hit"], cached_embeddings.stats.hits)
+        cache.add_metric(["query_embedding", "miss"], cached_embeddings.stats.misses)
+        cache.add_metric(["semantic_query", "hit"], semantic_query_cache.stats.hits)
+        cache.add_metric(["semantic_query", "miss"], semantic_query_cache.stats.misses)
+        cache.add_metric(["github_etag", "not_modified"], conditional_cache.stats.not_modified)
+        cache.add_metric(["github_etag", "fetched"], conditional_cache.stats.fetched)
+        yield cache
+
+        cache_errors = CounterMetricFamily("repoinsight_cache_errors", "캐시 저장소 오류 수", labels=["cache"])
+        cache_errors.add_metric(["search_result"], search_result_cache.stats.errors)
+        cache_errors.add_metric(["summary"], summary_cache.stats.errors)
+        cache_errors.add_metric(["query_embedding"], cached_embeddings.stats.errors)
+        cache_errors.add_metric(["semantic_query"], semantic_query_cache.stats.errors)
+        yield cache_errors
+
+        coalesced = CounterMetricFamily(
+            "repoinsight_single_flight", "동일 검색 합치기(single-flight) 결과별 횟수", labels=["result"]
+        )
+        coalesced.add_metric(["executed"], single_flight.stats.executions)
+        coalesced.add_metric(["local_coalesced"], single_flight.stats.local_coalesced)
+        coalesced.add_metric(["remote_coalesced"], single_flight.stats.remote_coalesced)
+        coalesced.add_metric(["fallback"], single_flight.stats.fallbacks)
+        yield coalesced
+
+        scheduler = get_scheduler()
+        upstream_errors = CounterMetricFamily(
+            "repoinsight_upstream_errors", "외부 API 호출 실패 수", labels=["upstream"]
+        )
+        upstream_errors.add_metric(["github"], scheduler.stats.upstream_errors)
+        upstream_errors.add_metric(["openai"], llm_governor.governor.stats.errors)
+        yield upstream_errors
+
+        rejections = CounterMetricFamily(
+            "repoinsight_rate_limit_rejections", "레이트 리밋으로 거절된 요청 수", labels=["limiter"]
+        )
+        rejections.add_metric(["ip"], ip_rate_limit_middleware.rate_limiter.rejected)
+        rejections.add_metric(["github_budget"], scheduler.stats.rejected)
+        rejections.add_metric(["github_response"], scheduler.stats.rate_limited_responses)
+        yield rejections
+
+        github_remaining = GaugeMetricFamily(
+            "repoinsight_github_rate_limit_remaining", "GitHub 토큰/리소스별 남은 요청 수", labels=["token", "resource"]
+        )
+        for budget in scheduler.snapshot():
+            if budget["remaining"] is not None:
+                github_remaining.add_metric([str(budget["token"]), budget["resource"]], budget["remaining"])
+        yield github_remaining
+
+        governor = llm_governor.governor
+        snapshot = governor.snapshot()
+        yield GaugeMetricFamily("repoinsight_llm_active", "실행 중인 LLM 호출 수", value=snapshot["active"])
+        yield GaugeMetricFamily("repoinsight_llm_queue_depth", "대기 중인 LLM 호출 수", value=snapshot["queue_depth"])
+        yield CounterMetricFamily("repoinsight_llm_calls", "LLM 호출 수", value=governor.stats.calls)
+        yield CounterMetricFamily(
+            "repoinsight_llm_wait_seconds", "LLM 호출 대기 시간 합계", value=governor.stats.total_wait_seconds
+        )
+        yield CounterMetricFamily(
+            "repoinsight_llm_tokens",
+            "LLM 사용 토큰 수 (응답의 usage 기준, usage가 없는 동기/실패 호출은 호출 전 추정치)",
+            value=governor.stats.tokens_used,
+        )
+
+        translation = CounterMetricFamily(
+            "repoinsight_query_translation", "검색 질문 번역 여부별 횟수 (skipped: 영어로 감지되어 생략)", labels=["result"]
+        )
+        translation.add_metric(["skipped"], language_detector.stats.skipped)
+        translation.add_metric(["translated"], language_detector.stats.translated)
+        yield translation
+
+        if event_loop_monitor.ENABLED:
+            yield GaugeMetricFamily(
+                "repoinsight_event_loop_lag_seconds", "최근 측정한 이벤트 루프 지연", value=event_loop_monitor.stats.last_lag_seconds
+            )
+
+
+add_stage_observer(_observe_stage)
+REGISTRY.register(_StatsCollector())
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """(본문, Content-Type)"""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
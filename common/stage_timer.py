@@ -0,0 +1,40 @@
+"""
+검색 파이프라인 단계별 소요 시간 측정.
+stage() 블록의 소요 시간을 로그로 남기고, 등록된 관찰자(벤치마크, 메트릭 등)에게 전달한다.
+"""
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from fastapi.logger import logger
+
+# (단계 이름, 소요 시간(초)) -> None
+StageObserver = Callable[[str, float], None]
+
+_observers: list[StageObserver] = []
+
+
+def add_stage_observer(observer: StageObserver) -> None:
+    _observers.append(observer)
+
+
+def remove_stage_observer(observer: StageObserver) -> None:
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+@contextmanager
+def stage(name: str, log: bool = True) -> Iterator[None]:
+    """
+    블록 실행 시간을 측정한다. (예외로 끝나도 측정)
+    리포지토리별 단계처럼 한 요청에서 여러 번 실행되는 단계는 log=False로 로그를 생략한다.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if log:
+            logger.info(f"[{name}] 실행 시간: {elapsed:.4f}초")
+        for observer in _observers:
+            observer(name, elapsed)
@@ -0,0 +1,73 @@
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from github.http_client import arequest
+
+# ---- 조건부 요청 캐시 설정 (환경변수로 조정 가능) ----
+CACHE_ENABLED: bool = os.getenv("GITHUB_ETAG_CACHE_ENABLED", "true").lower() == "true"
+CACHE_SIZE: int = int(os.getenv("GITHUB_ETAG_CACHE_SIZE", "2048"))
+
+
+@dataclass
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    body: Any
+
+
+@dataclass
+class ConditionalCacheStats:
+    not_modified: int = 0  # 304 응답으로 저장된 본문을 재사용한 횟수
+    fetched: int = 0  # 200 응답으로 새로 받은 횟수
+
+
+stats = ConditionalCacheStats()
+
+_cache: OrderedDict[str, CachedResponse] = OrderedDict()
+
+
+async def aget_json(url: str, params: dict[str, Any] | None = None) -> Any:
+    """
+    GitHub API GET 요청을 ETag/Last-Modified 기반 조건부 요청으로 보낸다.
+    - 이전 응답의 검증자가 있으면 If-None-Match / If-Modified-Since 헤더를 붙인다.
+    - 304 응답이면 저장해 둔 파싱된 본문을 그대로 반환한다.
+      (GitHub은 304 응답을 primary rate limit에 포함하지 않는다)
+    """
+    key = str(httpx.URL(url, params=params))
+    cached = _cache.get(key) if CACHE_ENABLED else None
+
+    headers: dict[str, str] = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    response = await arequest("GET", url, params=params, headers=headers)
+
+    if response.status_code == 304 and cached is not None:
+        stats.not_modified += 1
+        _cache.move_to_end(key)
+        return cached.body
+
+    response.raise_for_status()
+    body = response.json()
+    stats.fetched += 1
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if CACHE_ENABLED and (etag or last_modified):
+        _put(key, CachedResponse(etag=etag, last_modified=last_modified, body=body))
+
+    return body
+
+
+def _put(key: str, value: CachedResponse) -> None:
+    _cache[key] = value
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
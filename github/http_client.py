@@ -0,0 +1,70 @@
+import os
+
+import httpx
+
+from github.rate_limit_scheduler import get_scheduler
+
+# ---- GitHub HTTP 클라이언트 설정 (환경변수로 조정 가능) ----
+GITHUB_API_URL: str = os.getenv("GITHUB_API_URL", "https://api.github.com")
+TIMEOUT: float = float(os.getenv("GITHUB_HTTP_TIMEOUT", "20.0"))
+MAX_CONNECTIONS: int = int(os.getenv("GITHUB_HTTP_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("GITHUB_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+KEEPALIVE_EXPIRY: float = float(os.getenv("GITHUB_HTTP_KEEPALIVE_EXPIRY", "30.0"))
+HTTP2: bool = os.getenv("GITHUB_HTTP2", "true").lower() == "true"
+
+_client: httpx.AsyncClient | None = None
+
+
+def _build_headers() -> dict[str, str]:
+    # Authorization은 요청마다 스케줄러가 토큰 풀에서 골라 붙인다 (github/rate_limit_scheduler.py)
+    return {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
+
+def _create_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+    return httpx.AsyncClient(
+        timeout=TIMEOUT,
+        headers=_build_headers(),
+        limits=limits,
+        http2=HTTP2,
+    )
+
+
+def get_github_client() -> httpx.AsyncClient:
+    """
+    앱 전체에서 공유하는 GitHub API용 AsyncClient.
+    keep-alive 커넥션 풀을 재사용하여 매 요청마다 TCP+TLS 핸드셰이크가 발생하지 않도록 한다.
+    lifespan 밖(스크립트 등)에서 호출되면 지연 생성한다.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+    return _client
+
+
+async def arequest(method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    GitHub API 요청은 모두 이 함수를 거친다.
+    rate limit 스케줄러가 남은 한도를 보고 토큰을 골라 Authorization 헤더를 붙이고, 필요하면 대기시킨다.
+    """
+    return await get_scheduler().arequest(get_github_client(), method, url, **kwargs)
+
+
+async def start_github_client() -> None:
+    """lifespan startup에서 호출하여 클라이언트를 미리 만들어 둔다."""
+    get_github_client()
+
+
+async def close_github_client() -> None:
+    """lifespan shutdown에서 호출하여 커넥션 풀을 정리한다."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
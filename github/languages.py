@@ -1,76 +1,144 @@
+import asyncio
 import base64
-import os
-import httpx
 import yaml
 import time
+from collections import defaultdict
 from pathlib import Path
 
+from fastapi.logger import logger
+
 from common.exceptions import UnsupportedLanguageError, LinguistFetchError
+from github.http_client import GITHUB_API_URL, arequest
 
-URL = "https://api.github.com/repos/github-linguist/linguist/contents/lib/linguist/languages.yml"
+URL = f"{GITHUB_API_URL}/repos/github-linguist/linguist/contents/lib/linguist/languages.yml"
 PROJECT_ROOT = Path(__file__).resolve().parents[0]  # github
 CACHE_PATH = PROJECT_ROOT / "data" / "linguist_languages.yml"
 CACHE_TTL = 60 * 60 * 24  # 24시간
 
-headers = {
-    "Authorization": f"token {os.getenv("GIT_API_TOKEN")}",
-    "Accept": "application/vnd.github+json",
-    "X-GitHub-Api-Version": "2022-11-28",
-}
 
+_index: "LanguageIndex | None" = None
+_index_built_at: float = 0.0
+_index_lock = asyncio.Lock()
+
+
+class LanguageIndex:
+    """
+    linguist 언어 목록을 미리 가공해 둔 인메모리 인덱스.
+    - names: O(1) 멤버십 검사용 집합
+    - 부분 문자열 -> 정렬된 언어 목록 매핑 (자동완성 시 전체 스캔/정렬 없이 조회)
+    """
+
+    def __init__(self, names: set[str]):
+        self.names: frozenset[str] = frozenset(names)
+
+        substrings: dict[str, set[str]] = defaultdict(set)
+        for name in self.names:
+            for start in range(len(name)):
+                for end in range(start + 1, len(name) + 1):
+                    substrings[name[start:end]].add(name)
+
+        # 알파벳 순으로 미리 정렬해 둔다
+        self._substring_index: dict[str, tuple[str, ...]] = {
+            sub: tuple(sorted(matched)) for sub, matched in substrings.items()
+        }
 
-def validate_support(languages: list[str]):
-    supported = _fetch_languages_as_set()
-    unsupported = [lang for lang in languages if lang.lower() not in supported]
+    def __contains__(self, language: str) -> bool:
+        return language.lower() in self.names
+
+    def search(self, query: str) -> list[str]:
+        """query를 포함하는 언어 목록(알파벳 순)"""
+        return list(self._substring_index.get(query.lower(), ()))
+
+
+async def avalidate_support(languages: list[str]):
+    index = await aget_language_index()
+    unsupported = [lang for lang in languages if lang not in index]
 
     if unsupported:
         raise UnsupportedLanguageError(f"지원 되지 않는 언어입니다: {', '.join(unsupported)}")
 
-def find_languages_list_by_query(query: str):
-    languages = _fetch_languages_as_set()
+async def afind_languages_list_by_query(query: str):
+    index = await aget_language_index()
+
+    # 대소문자 무시하고 포함 여부 필터링 (정렬된 결과가 미리 계산되어 있음)
+    return index.search(query)
+
 
-    # 대소문자 무시하고 포함 여부 필터링
-    filtered = [
-        lang for lang in languages
-        if query.lower() in lang.lower()
-    ]
+async def aget_language_index() -> LanguageIndex:
+    """
+    프로세스 전역 언어 인덱스를 반환한다.
+    최초 호출 시 또는 TTL이 지난 경우에만 다시 만든다.
+    재생성에 실패하면 기존 인덱스를 계속 사용한다.
+    """
+    global _index, _index_built_at
 
-    # 알파벳 순 정렬
-    filtered_sorted = sorted(filtered)
+    if _index is not None and time.time() - _index_built_at < CACHE_TTL:
+        return _index
 
-    return filtered_sorted
+    async with _index_lock:
+        # 락 대기 중 다른 코루틴이 이미 재생성했을 수 있음
+        if _index is not None and time.time() - _index_built_at < CACHE_TTL:
+            return _index
 
+        try:
+            _index = await _aload_index()
+            _index_built_at = time.time()
+        except Exception as e:
+            if _index is None:
+                raise
+            logger.error(f"언어 인덱스 재생성 실패, 기존 인덱스 사용: {e}")
+            _index_built_at = time.time()
 
-def _fetch_languages_as_set() -> set[str]:
-    raw = _load_cached_or_fetch()
+    return _index
+
+
+def _build_index(raw: str) -> LanguageIndex:
     yml = yaml.safe_load(raw)
     if not isinstance(yml, dict):
         raise LinguistFetchError("YAML root is not a mapping/dict")
 
-    return {key.lower() for key in yml.keys()}
+    return LanguageIndex({key.lower() for key in yml.keys()})
 
 
-def _load_cached_or_fetch() -> str:
-    # 캐시 디렉토리 생성
-    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+async def _aload_index() -> LanguageIndex:
+    """
+    TTL 이내의 로컬 캐시가 있으면 그것으로, 없으면 GitHub에서 새로 가져와 저장한 뒤 인덱스를 만든다.
+    캐시 파일 읽기/쓰기와 YAML 파싱 + 인덱스 구축은 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+    """
+    index = await asyncio.to_thread(_load_cached_index)
+    if index is not None:
+        return index
+
+    raw = await _afetch_linguist_yaml()
+    return await asyncio.to_thread(_save_and_build_index, raw)
+
 
+def _load_cached_index() -> LanguageIndex | None:
     # 캐시가 있고 TTL 이내면 그대로 사용
-    if CACHE_PATH.exists():
-        mtime = CACHE_PATH.stat().st_mtime
-        if time.time() - mtime < CACHE_TTL:
-            return CACHE_PATH.read_text(encoding="utf-8")
+    try:
+        if time.time() - CACHE_PATH.stat().st_mtime >= CACHE_TTL:
+            return None
+        raw = CACHE_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    return _build_index(raw)
+
+
+def _save_and_build_index(raw: str) -> LanguageIndex:
+    # 파싱에 성공한 경우에만 캐시로 저장
+    index = _build_index(raw)
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(raw, encoding="utf-8")
+    return index
+
 
-    # 아니면 GitHub에서 새로 가져와서 저장
-    with httpx.Client(timeout=20.0, headers=headers) as client:
-        r = client.get(URL)
-        r.raise_for_status()
-        data = r.json()
+async def _afetch_linguist_yaml() -> str:
+    r = await arequest("GET", URL)
+    r.raise_for_status()
+    data = r.json()
 
     if data.get("encoding") != "base64" or "content" not in data:
         raise LinguistFetchError("Unexpected GitHub API response: no base64 content")
 
     b64 = data["content"].encode("utf-8")
-    raw = base64.b64decode(b64).decode("utf-8")
-
-    CACHE_PATH.write_text(raw, encoding="utf-8")
-    return raw
\ No newline at end of file
+    return base64.b64decode(b64).decode("utf-8")
@@ -0,0 +1,189 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+
+import httpx
+from fastapi.logger import logger
+
+from common.exceptions import GithubRateLimitError
+
+# ---- GitHub rate limit 스케줄러 설정 (환경변수로 조정 가능) ----
+RESERVE: int = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "1"))  # 토큰별로 남겨둘 여유 요청 수
+MAX_WAIT: float = float(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS", "10"))  # 한도 회복을 기다릴 최대 시간
+SECONDARY_LIMIT_BACKOFF: float = 60.0  # Retry-After 없는 secondary rate limit 응답 시 대기(초)
+
+
+@dataclass
+class _Budget:
+    """토큰 하나의 리소스(core/search/graphql)별 남은 한도"""
+    limit: int | None = None
+    remaining: int | None = None  # None이면 아직 모름 (첫 응답 전)
+    reset_at: float = 0.0  # 한도가 초기화되는 시각 (epoch)
+    blocked_until: float = 0.0  # secondary rate limit(Retry-After)로 막힌 시각 (epoch)
+    inflight: int = 0  # 응답을 기다리는 요청 수 (remaining에 아직 반영되지 않은 몫)
+
+    def available(self, now: float) -> float:
+        """지금 더 보낼 수 있는 요청 수 (모르면 무한대)"""
+        if now < self.blocked_until:
+            return 0
+        if self.remaining is None or now >= self.reset_at:
+            return float("inf")
+        return self.remaining - self.inflight - RESERVE
+
+    def ready_at(self, now: float) -> float:
+        """다시 보낼 수 있게 되는 시각"""
+        return max(self.blocked_until, self.reset_at if self.available(now) <= 0 else now)
+
+
+@dataclass
+class SchedulerStats:
+    requests: int = 0
+    throttled_waits: int = 0  # 모든 토큰의 한도가 부족해 기다린 횟수
+    rate_limited_responses: int = 0  # 403/429 rate limit 응답 수
+    rejected: int = 0  # MAX_WAIT 안에 한도가 회복되지 않아 거절한 횟수
+    upstream_errors: int = 0  # 5xx 응답/네트워크 오류 수
+
+
+@dataclass
+class GithubRequestScheduler:
+    """
+    GitHub API 호출 스케줄러.
+    - 토큰 풀(GIT_API_TOKENS)을 돌려 쓰며, 응답 헤더(X-RateLimit-*)로 토큰/리소스별 남은 한도를 추적한다.
+    - 한도가 가장 많이 남은 토큰을 고르고, 모두 부족하면 초기화 시각까지 기다린 뒤 보낸다. (MAX_WAIT 초과 시 거절)
+    - 403/429 rate limit 응답(Retry-After 포함)을 받으면 해당 토큰을 막고 다른 토큰으로 재시도한다.
+    """
+    tokens: list[str]
+    stats: SchedulerStats = field(default_factory=SchedulerStats)
+    _budgets: dict[tuple[int, str], _Budget] = field(default_factory=dict)
+
+    async def arequest(self, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+        resource = _guess_resource(url)
+        headers = kwargs.pop("headers", None) or {}
+
+        response: httpx.Response | None = None
+        for _ in range(len(self.tokens) + 1):
+            token_index = await self._aacquire(resource)
+            budget = self._budget(token_index, resource)
+            budget.inflight += 1
+            self.stats.requests += 1
+            try:
+                response = await client.request(
+                    method,
+                    url,
+                    headers={**headers, "Authorization": f"token {self.tokens[token_index]}"},
+                    **kwargs,
+                )
+            except httpx.HTTPError:
+                self.stats.upstream_errors += 1
+                raise
+            finally:
+                budget.inflight -= 1
+
+            if response.status_code >= 500:
+                self.stats.upstream_errors += 1
+
+            if not self._update(token_index, resource, response):
+                return response
+
+            self.stats.rate_limited_responses += 1
+            logger.warning(f"GitHub rate limit 응답 (token #{token_index}, {resource}), 다른 토큰으로 재시도")
+
+        return response
+
+    def snapshot(self) -> list[dict]:
+        """토큰/리소스별 한도 상태 (메트릭 노출용, 토큰 값은 포함하지 않음)"""
+        now = time.time()
+        return [
+            {
+                "token": token_index,
+                "resource": resource,
+                "limit": budget.limit,
+                "remaining": budget.remaining,
+                "reset_in": max(0.0, budget.reset_at - now),
+                "blocked_for": max(0.0, budget.blocked_until - now),
+                "inflight": budget.inflight,
+            }
+            for (token_index, resource), budget in sorted(self._budgets.items())
+        ]
+
+    async def _aacquire(self, resource: str) -> int:
+        """보낼 수 있는 토큰 중 한도가 가장 많이 남은 토큰을 고른다. 없으면 회복될 때까지 기다린다."""
+        while True:
+            now = time.time()
+            budgets = [self._budget(i, resource) for i in range(len(self.tokens))]
+            best = max(range(len(budgets)), key=lambda i: budgets[i].available(now))
+            if budgets[best].available(now) > 0:
+                return best
+
+            wait = min(budget.ready_at(now) for budget in budgets) - now
+            if wait > MAX_WAIT:
+                self.stats.rejected += 1
+                raise GithubRateLimitError(
+                    f"GitHub API 요청 한도를 초과했습니다. {int(wait)}초 뒤에 다시 시도해주세요."
+                )
+
+            self.stats.throttled_waits += 1
+            logger.warning(f"GitHub rate limit 한도 부족 ({resource}), {wait:.1f}초 대기")
+            await asyncio.sleep(max(wait, 0.05))
+
+    def _update(self, token_index: int, resource: str, response: httpx.Response) -> bool:
+        """응답 헤더로 한도 상태를 갱신한다. rate limit으로 거절된 응답이면 True."""
+        now = time.time()
+        headers = response.headers
+        budget = self._budget(token_index, headers.get("X-RateLimit-Resource", resource))
+
+        if "X-RateLimit-Remaining" in headers:
+            budget.remaining = int(headers["X-RateLimit-Remaining"])
+            budget.limit = int(headers.get("X-RateLimit-Limit", budget.limit or 0))
+            budget.reset_at = float(headers.get("X-RateLimit-Reset", now))
+
+        if response.status_code not in (403, 429):
+            return False
+
+        if "Retry-After" in headers:
+            # secondary rate limit
+            budget.blocked_until = now + float(headers["Retry-After"])
+            return True
+        if budget.remaining == 0:
+            # primary rate limit (reset_at까지 사용 불가)
+            return True
+        if response.status_code == 429 or "secondary rate limit" in response.text.lower():
+            budget.blocked_until = now + SECONDARY_LIMIT_BACKOFF
+            return True
+
+        # 권한 없음 등 rate limit과 무관한 403
+        return False
+
+    def _budget(self, token_index: int, resource: str) -> _Budget:
+        key = (token_index, resource)
+        if key not in self._budgets:
+            self._budgets[key] = _Budget()
+        return self._budgets[key]
+
+
+_scheduler: GithubRequestScheduler | None = None
+
+
+def get_scheduler() -> GithubRequestScheduler:
+    """
+    앱 전체에서 공유하는 스케줄러.
+    토큰 풀은 GIT_API_TOKENS(쉼표 구분), 없으면 GIT_API_TOKEN 하나를 사용한다.
+    """
+    global _scheduler
+    if _scheduler is None:
+        tokens = [token.strip() for token in os.getenv("GIT_API_TOKENS", "").split(",") if token.strip()]
+        if not tokens:
+            tokens = [os.getenv("GIT_API_TOKEN", "")]
+        _scheduler = GithubRequestScheduler(tokens=tokens)
+    return _scheduler
+
+
+def _guess_resource(url: str) -> str:
+    """요청 전 URL로 GitHub rate limit 리소스 종류를 추정 (응답 후에는 X-RateLimit-Resource 헤더 사용)"""
+    path = httpx.URL(url).path
+    if path.startswith("/search/"):
+        return "search"
+    if path.startswith("/graphql"):
+        return "graphql"
+    return "core"
@@ -0,0 +1,66 @@
+import os
+
+from common.exceptions import GithubGraphQLError
+from github.http_client import GITHUB_API_URL, arequest
+
+# 로컬 스텁 서버 등으로 대체할 수 있도록 환경변수로 엔드포인트 지정 가능
+GRAPHQL_URL: str = os.getenv("GITHUB_GRAPHQL_URL", f"{GITHUB_API_URL}/graphql")
+MAX_LANGUAGES: int = 100  # GraphQL connection 최대 페이지 크기
+
+_REPOSITORY_FIELDS = """
+    languages(first: %d, orderBy: {field: SIZE, direction: DESC}) {
+      edges { size node { name } }
+    }
+""" % MAX_LANGUAGES
+
+
+async def aload_repositories_languages(full_names: list[str]) -> list[dict[str, int]]:
+    """
+    GitHub GraphQL API를 한 번만 호출해 여러 리포지토리의
+    언어별 byte 수 dict를 full_names 순서대로 반환한다.
+    (REST languages_url을 N번 호출하는 대신 1번의 왕복 + 1번의 rate limit 차감)
+
+    예시 응답 원소:
+    {
+        "Python": 40479,
+        "Shell": 1352
+    }
+    """
+    if not full_names:
+        return []
+
+    query, variables = _build_query(full_names)
+
+    response = await arequest("POST", GRAPHQL_URL, json={"query": query, "variables": variables})
+    response.raise_for_status()
+    payload = response.json()
+
+    data = payload.get("data")
+    if not data:
+        raise GithubGraphQLError(f"GitHub GraphQL 응답에 데이터가 없습니다: {payload.get('errors')}")
+
+    results: list[dict[str, int]] = []
+    for i in range(len(full_names)):
+        # 접근할 수 없는 리포지토리는 null로 오므로 빈 dict로 처리
+        repository = data.get(f"r{i}") or {}
+        edges = (repository.get("languages") or {}).get("edges") or []
+        results.append({edge["node"]["name"]: edge["size"] for edge in edges})
+
+    return results
+
+
+def _build_query(full_names: list[str]) -> tuple[str, dict[str, str]]:
+    """리포지토리마다 alias(r0, r1, ...)를 붙인 단일 GraphQL 쿼리를 만든다."""
+    params: list[str] = []
+    fields: list[str] = []
+    variables: dict[str, str] = {}
+
+    for i, full_name in enumerate(full_names):
+        owner, name = full_name.split("/", 1)
+        params.append(f"$o{i}: String!, $n{i}: String!")
+        fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{{_REPOSITORY_FIELDS}}}")
+        variables[f"o{i}"] = owner
+        variables[f"n{i}"] = name
+
+    query = f"query({', '.join(params)}) {{\n" + "\n".join(fields) + "\n}"
+    return query, variables
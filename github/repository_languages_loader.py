@@ -1,13 +1,15 @@
-import httpx
+import asyncio
 import os
+from typing import Any, Awaitable, Callable
 
-HEADERS = {
-    "Authorization": f"token {os.getenv('GIT_API_TOKEN')}",
-    "Accept": "application/vnd.github+json",
-    "X-GitHub-Api-Version": "2022-11-28",
-}
+from github.conditional_cache import aget_json
+from github.repository_graphql_loader import aload_repositories_languages
 
-def load_repository_languages(languages_url: str) -> dict[str, int]:
+# 언어 조회 방식: "rest" (리포지토리마다 languages_url 호출) | "graphql" (한 번에 일괄 조회)
+LANGUAGES_LOADER: str = os.getenv("GITHUB_LANGUAGES_LOADER", "rest").lower()
+
+
+async def aload_repository_languages(languages_url: str) -> dict[str, int]:
     """
     GitHub Repository의 languages_url을 호출하여
     언어별 byte 수 dict를 그대로 반환한다.
@@ -18,7 +20,27 @@ def load_repository_languages(languages_url: str) -> dict[str, int]:
         "Shell": 1352
     }
     """
-    with httpx.Client(timeout=20.0, headers=HEADERS) as client:
-        response = client.get(languages_url)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    # 변경이 없으면 304 응답으로 저장된 본문을 재사용한다
+    return await aget_json(languages_url)
+
+
+def prepare_languages_loaders(repos: list[dict[str, Any]]) -> list[Callable[[], Awaitable[dict[str, int]]]]:
+    """
+    검색 결과 리포지토리별 언어 조회 함수 목록을 repos 순서대로 반환한다. (호출하면 해당 리포지토리의 awaitable)
+    GITHUB_LANGUAGES_LOADER 설정에 따라 REST(리포지토리마다 호출) 또는 GraphQL(1번 일괄 호출)을 사용한다.
+    - REST: 함수를 호출할 때 요청을 만든다. 호출 측 동시성 제한 안에서 호출하면 되고,
+      취소되어 호출하지 않은 리포지토리는 요청(코루틴)이 아예 만들어지지 않는다.
+    - GraphQL: 일괄 조회는 지금 바로 시작하고, 각 함수는 그 결과에서 자기 리포지토리 몫을 꺼낸다.
+    """
+    if LANGUAGES_LOADER == "graphql":
+        batch = asyncio.ensure_future(aload_repositories_languages([repo["full_name"] for repo in repos]))
+        # 모든 리포지토리가 취소되어 아무도 기다리지 않아도 예외가 "never retrieved"로 남지 않도록 회수
+        batch.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return [lambda i=i: _aselect(batch, i) for i in range(len(repos))]
+
+    return [lambda url=repo["languages_url"]: aload_repository_languages(url) for repo in repos]
+
+
+async def _aselect(batch: Awaitable[list[dict[str, int]]], index: int) -> dict[str, int]:
+    results = await batch
+    return results[index]
@@ -1,17 +1,12 @@
-import httpx
-import os
 from typing import Any
 
-SEARCH_URL = "https://api.github.com/search/repositories"
+from github.conditional_cache import aget_json
+from github.http_client import GITHUB_API_URL
 
-HEADERS = {
-    "Authorization": f"token {os.getenv("GIT_API_TOKEN")}",
-    "Accept": "application/vnd.github+json",
-    "X-GitHub-Api-Version": "2022-11-28",
-}
+SEARCH_URL = f"{GITHUB_API_URL}/search/repositories"
 
 
-def load_search_results(
+async def aload_search_results(
     query: str,
     sort: str,
     order: str,
@@ -34,8 +29,5 @@ def load_search_results(
         "per_page": per_page,
     }
 
-    with httpx.Client(timeout=20.0, headers=HEADERS) as client:
-        response = client.get(SEARCH_URL, params=params)
-        response.raise_for_status()
-        data = response.json()
-        return data.get("items", [])
\ No newline at end of file
+    data = await aget_json(SEARCH_URL, params=params)
+    return data.get("items", [])
@@ -1,5 +1,6 @@
 import time
 import httpx
+from dataclasses import dataclass
 from urllib.parse import urlparse
 
 
@@ -13,12 +14,39 @@ FOLLOW_REDIRECTS: bool = True
 USER_AGENT: str = "repoinsight/1.0"
 
 
+@dataclass
+class ConditionalDocs:
+    text: str | None  # None이면 이전 요청 이후 변경 없음 (304)
+    etag: str | None
+    last_modified: str | None
+
+
 def fetch_github_docs(doc_url: str):
     """GitHub Docs 페이지 URL을 받아 분할된 문서 리스트 반환.
     """
     md_url = _get_markdown_url(doc_url)
     return _fetch_markdown(
         md_url=md_url,
+    ).text
+
+
+def fetch_github_docs_if_modified(
+    doc_url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> ConditionalDocs:
+    """이전 응답의 ETag/Last-Modified로 조건부 요청. 페이지가 바뀌지 않았으면 text가 None."""
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    r = _fetch_markdown(md_url=_get_markdown_url(doc_url), headers=headers)
+    return ConditionalDocs(
+        text=None if r.status_code == 304 else r.text,
+        etag=r.headers.get("ETag", etag),
+        last_modified=r.headers.get("Last-Modified", last_modified),
     )
 
 def _get_markdown_url(doc_url: str) -> str:
@@ -27,7 +55,7 @@ def _get_markdown_url(doc_url: str) -> str:
     return f"https://docs.github.com/api/article/body?pathname={path}"
 
 
-def _fetch_markdown(md_url: str) -> str:
+def _fetch_markdown(md_url: str, headers: dict[str, str] | None = None) -> httpx.Response:
     last_err: Exception | None = None
 
     client = httpx.Client(
@@ -39,9 +67,11 @@ def _fetch_markdown(md_url: str) -> str:
     try:
         for attempt in range(MAX_RETRIES + 1):
             try:
-                r = client.get(md_url, headers={"Accept": ACCEPT_HEADER})
-                r.raise_for_status()
-                return r.text
+                r = client.get(md_url, headers={"Accept": ACCEPT_HEADER, **(headers or {})})
+                # 304(변경 없음)는 조건부 요청의 정상 응답
+                if r.status_code != 304:
+                    r.raise_for_status()
+                return r
             except Exception as e:
                 last_err = e
                 if attempt >= MAX_RETRIES:
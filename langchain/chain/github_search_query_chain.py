@@ -1,16 +1,22 @@
+import os
+
 from dotenv import load_dotenv
 from fastapi.logger import logger
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnablePassthrough, RunnableLambda
+from langchain_core.runnables import Runnable, RunnableConfig, RunnablePassthrough, RunnableLambda
 from langchain_text_splitters import MarkdownHeaderTextSplitter
-from langchain_openai import ChatOpenAI
 
 from operator import itemgetter
 from datetime import datetime
 
+from common.stage_timer import stage
 from github.web_docs_loader import fetch_github_docs
-from langchain.prompt.search_prompt import translate_prompt, search_query_prompt
+from langchain import language_detector, semantic_query_cache
+from langchain.embedding.cached_embeddings import with_query_cache
+from langchain.llm_governor import govern
+from langchain.llm_registry import get_chat_model, get_embeddings
+from langchain.prompt.search_prompt import translate_prompt, search_query_prompt, translate_search_query_prompt
 
 from langchain.vector_store.github_search_qualifier_store_base import GithubSearchQualifierStoreBase
 
@@ -19,42 +25,72 @@ load_dotenv()
 REPOSITORIES_SEARCH_DOCS_URL = "https://docs.github.com/en/search-github/searching-on-github/searching-for-repositories"
 HEADERS_TO_SPLIT_ON = [("##", "Topic")]
 
+# ---- 검색 쿼리 체인 설정 (환경변수로 조정 가능) ----
+# three_hop: 번역(LLM) -> 번역된 질문으로 검색 -> 쿼리 생성(LLM)
+# single_call: 원본 질문으로 검색 -> 번역 + 쿼리 생성(LLM 한 번)
+QUERY_CHAIN_MODE: str = os.getenv("QUERY_CHAIN_MODE", "three_hop").lower()
+
 
 class GithubSearchQueryChain:
     """ GitHub Search Query Builder """
 
-    def __init__(self, vector_db: GithubSearchQualifierStoreBase):
+    def __init__(self, vector_db: GithubSearchQualifierStoreBase, mode: str = QUERY_CHAIN_MODE):
         """외부에서 Vector DB 주입"""
 
 
-        retriever = vector_db.get_retriever(top_k=5)
-
-        translate_chain = self._get_translation_chain()
-        search_query_chain = self._get_search_query_chain()
+        retriever = _timed("retrieval", vector_db.get_retriever(top_k=5))
 
         def debug(name):
             return RunnableLambda(lambda x: (logger.info(f"{name}: {x}"), x)[1])
 
-        self.search_query_chain = (
-                RunnablePassthrough()
-                .assign(
-                    current_date=RunnableLambda(lambda _: datetime.now().strftime("%Y-%m-%d")) | debug("현재 날짜"),
-                    original_question=RunnableLambda(itemgetter("question")) | debug("원본 질문"),
-                    languages=RunnableLambda(itemgetter("languages")) | debug("언어 목록"),
-                )
-                .assign(
-                    translated_question=RunnableLambda(itemgetter("original_question")) | translate_chain | debug("번역된 질문"),
-                )
-                .assign(
-                    question=RunnableLambda(itemgetter("translated_question")),
-                    context=RunnableLambda(itemgetter("translated_question"))
-                            | retriever
-                            | RunnableLambda(lambda docs: [doc.metadata for doc in docs])
-                            | debug("찾아온 문서"),
-                )
-                | search_query_chain
+        def retrieve_context(key: str) -> Runnable:
+            return (
+                RunnableLambda(itemgetter(key))
+                | retriever
+                | RunnableLambda(lambda docs: [doc.metadata for doc in docs])
+                | debug("찾아온 문서")
+            )
+
+        inputs = RunnablePassthrough().assign(
+            current_date=RunnableLambda(lambda _: datetime.now().strftime("%Y-%m-%d")) | debug("현재 날짜"),
+            original_question=RunnableLambda(itemgetter("question")) | debug("원본 질문"),
+            languages=RunnableLambda(itemgetter("languages")) | debug("언어 목록"),
         )
 
+        if mode == "single_call":
+            # 원본 질문으로 바로 검색하고(다국어 임베딩), 번역과 쿼리 생성은 LLM 호출 한 번으로 처리
+            translate_search_query_chain = _timed(
+                "query_generation", self._get_search_query_chain(translate_search_query_prompt)
+            )
+            self.search_query_chain = (
+                    inputs
+                    .assign(context=retrieve_context("original_question"))
+                    | translate_search_query_chain
+            )
+        elif mode == "three_hop":
+            translate_chain = _translate_if_needed(_timed("translation", self._get_translation_chain()))
+            search_query_chain = _timed("query_generation", self._get_search_query_chain(search_query_prompt))
+            self.search_query_chain = (
+                    inputs
+                    .assign(
+                        translated_question=RunnableLambda(itemgetter("original_question")) | translate_chain | debug("번역된 질문"),
+                    )
+                    .assign(
+                        question=RunnableLambda(itemgetter("translated_question")),
+                        context=retrieve_context("translated_question"),
+                    )
+                    | search_query_chain
+            )
+        else:
+            raise ValueError(f"지원하지 않는 QUERY_CHAIN_MODE: {mode} (three_hop | single_call)")
+        logger.info(f"검색 쿼리 체인 모드: {mode}")
+
+        # 비슷한 질문이면 이전에 생성한 쿼리를 재사용 (semantic_query_cache)
+        self.query_cache = None
+        if semantic_query_cache.CACHE_ENABLED:
+            model = semantic_query_cache.EMBEDDING_MODEL
+            self.query_cache = semantic_query_cache.SemanticQueryCache(with_query_cache(get_embeddings(model), model))
+
     @staticmethod
     def _load_search_docs():
         md_text = fetch_github_docs(REPOSITORIES_SEARCH_DOCS_URL)
@@ -66,14 +102,14 @@ class GithubSearchQueryChain:
         """
         필요한 입력값: question(사용자의 요청)
         """
-        llm = ChatOpenAI(model="gpt-4.1-mini")
+        llm = govern(get_chat_model("gpt-4.1-mini"))
         translate_question_template = PromptTemplate(
             template=translate_prompt,
             input_variables=["question"])
         return translate_question_template | llm | StrOutputParser()
 
     @staticmethod
-    def _get_search_query_chain():
+    def _get_search_query_chain(prompt: str):
         """
         필요한 입력값:
             - current_date: 현재 날짜
@@ -81,12 +117,49 @@ class GithubSearchQueryChain:
             - context: 검색 한정자 사용법
             - languages: 사용자가 선택한 언어 목록
         """
-        llm = ChatOpenAI(model="gpt-4.1")
+        llm = govern(get_chat_model("gpt-4.1"))
         search_query_template = PromptTemplate.from_template(
-            search_query_prompt,
+            prompt,
             template_format="jinja2"
         )
         return search_query_template | llm | StrOutputParser()
 
     def invoke(self, question: str, languages: list):
-        return self.search_query_chain.invoke({"question": question, "languages": languages})
\ No newline at end of file
+        def generate():
+            return self.search_query_chain.invoke({"question": question, "languages": languages})
+
+        if self.query_cache is None:
+            return generate()
+        return self.query_cache.get_or_generate(question, languages, generate)
+
+    async def ainvoke(self, question: str, languages: list):
+        """invoke의 비동기 버전. LLM/임베딩/벡터 검색 호출이 이벤트 루프를 막지 않는다."""
+        async def agenerate():
+            return await self.search_query_chain.ainvoke({"question": question, "languages": languages})
+
+        if self.query_cache is None:
+            return await agenerate()
+        return await self.query_cache.aget_or_generate(question, languages, agenerate)
+
+
+def _translate_if_needed(translate_chain: Runnable) -> Runnable:
+    """이미 영어인 질문은 번역 LLM 호출 없이 그대로 사용한다. (language_detector)"""
+
+    def route(question: str):
+        return translate_chain if language_detector.needs_translation(question) else question
+
+    return RunnableLambda(route, name="translate_if_needed")
+
+
+def _timed(name: str, runnable: Runnable) -> Runnable:
+    """체인 단계의 소요 시간을 stage_timer로 측정한다. (결과는 debug 로그로 남기므로 시간 로그는 생략)"""
+
+    def invoke(value, config: RunnableConfig):
+        with stage(name, log=False):
+            return runnable.invoke(value, config)
+
+    async def ainvoke(value, config: RunnableConfig):
+        with stage(name, log=False):
+            return await runnable.ainvoke(value, config)
+
+    return RunnableLambda(invoke, afunc=ainvoke, name=name)
@@ -1,7 +1,8 @@
 from langchain_core.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
+from langchain.llm_governor import govern
+from langchain.llm_registry import get_chat_model
 from langchain.prompt.search_prompt import simple_summary_prompt, simple_summary_prompt_async
 
 CHAT_MODEL = 'gpt-4.1-nano'
@@ -11,15 +12,29 @@ class SummaryList(BaseModel):
     # repos 순서대로, 각 리포지토리당 3줄 요약 리스트
     summaries: list[str]
 
+class BatchSummaryList(BaseModel):
+    # repo_list 순서대로, 리포지토리마다 3줄 요약 리스트
+    summaries: list[list[str]]
+
 class SimpleGithubRepositorySummaryChain:
     def __init__(self):
         simple_summary_prompt_template = PromptTemplate(
             template=simple_summary_prompt_async,
             input_variables=["repo"],
         )
+        batch_summary_prompt_template = PromptTemplate(
+            template=simple_summary_prompt,
+            input_variables=["repo_list"],
+        )
 
-        llm = ChatOpenAI(model=CHAT_MODEL).with_structured_output(SummaryList)
-        self.summary_chain = simple_summary_prompt_template | llm
+        # include_raw=True: 거버너가 raw 응답의 사용량으로 분당 토큰 한도를 보정한다
+        llm = get_chat_model(CHAT_MODEL)
+        self.summary_chain = simple_summary_prompt_template | govern(
+            llm.with_structured_output(SummaryList, include_raw=True)
+        )
+        self.batch_summary_chain = batch_summary_prompt_template | govern(
+            llm.with_structured_output(BatchSummaryList, include_raw=True)
+        )
 
     async def ainvoke(self, metadata: dict) -> list[str]:
         """
@@ -29,4 +44,19 @@ class SimpleGithubRepositorySummaryChain:
         result: SummaryList = await self.summary_chain.ainvoke(
             {"repo": metadata}
         )
-        return result.summaries
\ No newline at end of file
+        return result.summaries
+
+    async def abatch_invoke(self, metadata_list: list[dict]) -> list[list[str]]:
+        """
+        metadata_list: 여러 리포지토리의 메타데이터 정보
+        반환값: metadata_list 순서대로 리포지토리별 3줄 요약 (한 번의 LLM 호출)
+        모델이 리포지토리 수와 다른 개수를 반환하면 ValueError
+        """
+        result: BatchSummaryList = await self.batch_summary_chain.ainvoke(
+            {"repo_list": metadata_list}
+        )
+        if len(result.summaries) != len(metadata_list):
+            raise ValueError(
+                f"요약 개수가 리포지토리 수와 다릅니다: {len(result.summaries)} != {len(metadata_list)}"
+            )
+        return result.summaries
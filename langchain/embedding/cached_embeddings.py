@@ -0,0 +1,220 @@
+import asyncio
+import hashlib
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from fastapi.logger import logger
+from langchain_core.embeddings import Embeddings
+
+from common.config.redis_client import get_async_redis_client, get_redis_client
+
+# ---- 쿼리 임베딩 캐시 설정 (환경변수로 조정 가능) ----
+CACHE_BACKEND: str = os.getenv("EMBEDDING_CACHE_BACKEND", "redis").lower()  # redis | disk | none
+CACHE_TTL: int = int(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", str(60 * 60 * 24 * 7)))  # 7일
+CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000"))  # disk 전용 (Redis는 maxmemory 정책)
+PROJECT_ROOT = Path(__file__).resolve().parents[0]  # langchain/embedding
+CACHE_DIR = Path(os.getenv("EMBEDDING_CACHE_DIR", PROJECT_ROOT / "data" / "query_embeddings"))
+KEY_PREFIX = "query_embedding:"
+
+
+class EmbeddingByteStore(ABC):
+    """임베딩 벡터(bytes)를 저장하는 키-값 저장소 인터페이스"""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        pass
+
+    async def aget(self, key: str) -> bytes | None:
+        return self.get(key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        self.set(key, value)
+
+
+class RedisEmbeddingByteStore(EmbeddingByteStore):
+    """Redis 저장소. TTL 만료 후 재계산하며, 용량 초과 시 eviction은 Redis maxmemory 정책(allkeys-lru)을 따른다."""
+
+    def __init__(self, ttl: int = CACHE_TTL):
+        self._ttl = ttl
+
+    def get(self, key: str) -> bytes | None:
+        return get_redis_client().get(KEY_PREFIX + key)
+
+    def set(self, key: str, value: bytes) -> None:
+        get_redis_client().set(KEY_PREFIX + key, value, ex=self._ttl)
+
+    async def aget(self, key: str) -> bytes | None:
+        return await get_async_redis_client().get(KEY_PREFIX + key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        await get_async_redis_client().set(KEY_PREFIX + key, value, ex=self._ttl)
+
+
+class DiskEmbeddingByteStore(EmbeddingByteStore):
+    """
+    로컬 디스크 저장소. 키마다 파일 하나.
+    - TTL: 파일 수정 시각 기준으로 만료
+    - LRU: 조회 시 수정 시각을 갱신하고, max_entries를 EVICT_SLACK 이상 넘으면 오래된 파일부터 max_entries까지 삭제
+      (저장할 때마다 디렉터리를 훑지 않도록 항목 수는 메모리에서 센다)
+    - 비동기 경로에서는 파일 I/O를 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    EVICT_SLACK = 0.1  # max_entries 대비 허용 초과 비율
+    TMP_SUFFIX = ".tmp"
+
+    def __init__(self, directory: Path = CACHE_DIR, max_entries: int = CACHE_MAX_ENTRIES, ttl: int = CACHE_TTL):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max_entries
+        self._evict_threshold = max_entries + max(1, int(max_entries * self.EVICT_SLACK))
+        self._ttl = ttl
+        self._count = len(self._entries())
+
+    def get(self, key: str) -> bytes | None:
+        path = self._directory / key
+        try:
+            if time.time() - path.stat().st_mtime > self._ttl:
+                path.unlink(missing_ok=True)
+                return None
+            value = path.read_bytes()
+            path.touch()
+            return value
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        path = self._directory / key
+        is_new = not path.exists()
+        tmp_path = path.with_name(path.name + self.TMP_SUFFIX)
+        tmp_path.write_bytes(value)
+        os.replace(tmp_path, path)
+        if is_new:
+            self._count += 1
+        if self._count > self._evict_threshold:
+            self._evict()
+
+    async def aget(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+    def _entries(self) -> list[Path]:
+        return [path for path in self._directory.iterdir() if not path.name.endswith(self.TMP_SUFFIX)]
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        overflow = len(entries) - self._max_entries
+        if overflow > 0:
+            entries.sort(key=lambda p: p.stat().st_mtime)
+            for path in entries[:overflow]:
+                path.unlink(missing_ok=True)
+        self._count = min(len(entries), self._max_entries)
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+stats = EmbeddingCacheStats()
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    검색 질의 임베딩(embed_query) 결과를 캐시하는 래퍼.
+    키: 모델명 + 정규화된 질의(공백/대소문자 무시) 해시
+    문서 임베딩(embed_documents)은 문서 갱신 때만 호출되므로 그대로 위임한다.
+    저장소 장애 시에는 캐시 없이 원래 임베딩을 사용한다.
+    """
+
+    def __init__(self, underlying: Embeddings, store: EmbeddingByteStore, model_name: str):
+        self.underlying = underlying
+        self._store = store
+        self._model_name = model_name
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.underlying.embed_documents(texts)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.underlying.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._build_key(text)
+        try:
+            cached = self._store.get(key)
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"임베딩 캐시 조회 실패: {e}")
+            cached = None
+
+        if cached is not None:
+            stats.hits += 1
+            return _decode(cached)
+
+        stats.misses += 1
+        vector = self.underlying.embed_query(text)
+        try:
+            self._store.set(key, _encode(vector))
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"임베딩 캐시 저장 실패: {e}")
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = self._build_key(text)
+        try:
+            cached = await self._store.aget(key)
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"임베딩 캐시 조회 실패: {e}")
+            cached = None
+
+        if cached is not None:
+            stats.hits += 1
+            return _decode(cached)
+
+        stats.misses += 1
+        vector = await self.underlying.aembed_query(text)
+        try:
+            await self._store.aset(key, _encode(vector))
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"임베딩 캐시 저장 실패: {e}")
+        return vector
+
+    def _build_key(self, text: str) -> str:
+        normalized = " ".join(text.lower().split())
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{self._model_name}:{digest}"
+
+
+def with_query_cache(embedding: Embeddings, model_name: str) -> Embeddings:
+    """EMBEDDING_CACHE_BACKEND 설정에 맞는 저장소로 질의 임베딩 캐시를 씌운다."""
+    if CACHE_BACKEND == "redis":
+        return CachedQueryEmbeddings(embedding, RedisEmbeddingByteStore(), model_name)
+    if CACHE_BACKEND == "disk":
+        return CachedQueryEmbeddings(embedding, DiskEmbeddingByteStore(), model_name)
+    return embedding
+
+
+def _encode(vector: list[float]) -> bytes:
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _decode(value: bytes) -> list[float]:
+    return np.frombuffer(value, dtype=np.float32).tolist()
@@ -0,0 +1,37 @@
+"""
+검색 질문 언어 감지 (로컬, 외부 호출 없음).
+번역 프롬프트는 영어 입력을 그대로 돌려주므로, 이미 영어인 질문은 번역 LLM 호출을 건너뛴다.
+- 글자(letter)가 모두 ASCII이면 영어로 본다. (한글/한자/가나, 악센트가 붙은 라틴 문자 등이 하나라도 있으면 번역)
+- 글자가 없는 질문(숫자/기호만)도 번역 결과가 같으므로 건너뛴다.
+"""
+import os
+from dataclasses import dataclass
+
+# ---- 번역 생략 설정 (환경변수로 조정 가능) ----
+FAST_PATH_ENABLED: bool = os.getenv("TRANSLATION_FAST_PATH_ENABLED", "true").lower() == "true"
+
+
+@dataclass
+class TranslationStats:
+    skipped: int = 0  # 영어로 감지되어 번역 LLM 호출을 건너뛴 횟수
+    translated: int = 0
+
+    def skip_rate(self) -> float:
+        total = self.skipped + self.translated
+        return self.skipped / total if total else 0.0
+
+
+stats = TranslationStats()
+
+
+def is_english(text: str) -> bool:
+    return all(char.isascii() for char in text if char.isalpha())
+
+
+def needs_translation(question: str) -> bool:
+    """번역이 필요한지 판단하고 결과를 stats에 집계한다."""
+    if FAST_PATH_ENABLED and is_english(question):
+        stats.skipped += 1
+        return False
+    stats.translated += 1
+    return True
@@ -0,0 +1,312 @@
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+from fastapi.logger import logger
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+
+from common.config.redis_client import get_async_redis_client
+
+# ---- LLM 호출 거버너 설정 (환경변수로 조정 가능) ----
+MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))  # 프로세스 전체 동시 LLM 호출 수
+TOKENS_PER_MINUTE: int = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))  # 분당 토큰 한도 (0이면 제한 없음)
+ESTIMATED_OUTPUT_TOKENS: int = int(os.getenv("LLM_ESTIMATED_OUTPUT_TOKENS", "300"))  # 호출 전 출력 토큰 추정치
+# true면 분당 토큰 한도를 Redis로 여러 워커가 함께 나눠 쓴다
+DISTRIBUTED: bool = os.getenv("LLM_GOVERNOR_DISTRIBUTED", "false").lower() == "true"
+REDIS_KEY = "llm_governor:tpm"
+REDIS_RETRY_INTERVAL: float = 5.0  # Redis 장애 감지 후 다시 시도하기까지 대기(초)
+CHARS_PER_TOKEN: int = 4  # 토큰 수 추정용 (영문 기준 대략치)
+
+# 공정 큐 단위. 검색 요청마다 설정하면 한 요청의 요약 N개가 다른 요청을 밀어내지 않는다.
+llm_request_key: ContextVar[str] = ContextVar("llm_request_key", default="default")
+
+# 토큰 버킷 검사 + 차감을 한 번의 왕복으로 처리하는 Lua 스크립트
+# - KEYS[1]: 버킷 키 (hash: tokens, ts)
+# - ARGV[1]: 버킷 크기(분당 토큰), ARGV[2]: 필요한 토큰 수
+# - 반환: 다시 시도할 때까지 기다릴 시간(ms), 0이면 차감 완료
+TOKEN_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local capacity = tonumber(ARGV[1])
+local need = tonumber(ARGV[2])
+local rate = capacity / 60000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+
+if tokens < math.min(need, capacity) then
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], 120000)
+    return math.ceil((math.min(need, capacity) - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens - need, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], 120000)
+return 0
+"""
+
+
+@dataclass
+class LLMGovernorStats:
+    calls: int = 0
+    sync_calls: int = 0  # 대기 없이 한도만 차감한 동기 호출 수
+    queued: int = 0  # 즉시 실행되지 못하고 대기한 호출 수
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    max_queue_depth: int = 0
+    tokens_used: int = 0  # 호출별 응답 사용량 합계 (사용량이 없는 호출은 추정치), 증가만 한다
+    remote_waits: int = 0  # Redis 분당 토큰 한도로 대기한 횟수
+    errors: int = 0  # LLM 호출 실패 수
+
+    def average_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass
+class _Ticket:
+    tokens: int
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class LLMSlot:
+    """
+    aslot()이 넘겨주는 실행 권한. 실제 사용 토큰을 알게 되면 settle()로 토큰 버킷의 추정치와의 차이를 보정한다.
+    stats.tokens_used는 호출마다 한 번만 늘린다. (보정값은 음수일 수 있어 누적 카운터에 넣지 않는다)
+    """
+
+    def __init__(self, governor: "LLMGovernor", estimated_tokens: int):
+        self._governor = governor
+        self._estimated_tokens = estimated_tokens
+        self._counted = False
+
+    def settle(self, actual_tokens: int) -> None:
+        self._governor._consume(actual_tokens - self._estimated_tokens)
+        self._estimated_tokens = actual_tokens
+        if not self._counted:
+            self._governor.stats.tokens_used += actual_tokens
+            self._counted = True
+
+    def close(self) -> None:
+        """aslot() 블록을 벗어날 때 호출. 사용량을 알 수 없던 호출(실패 등)은 추정치로 집계한다."""
+        if not self._counted:
+            self._governor.stats.tokens_used += self._estimated_tokens
+            self._counted = True
+
+
+class LLMGovernor:
+    """
+    프로세스 전체 LLM 호출 거버너.
+    - 동시 호출 수를 max_concurrency로 제한한다.
+    - 분당 토큰(tokens_per_minute)을 토큰 버킷으로 제한한다. 호출 전 추정치로 차감하고, 응답의 사용량으로 보정한다.
+    - 대기열은 요청 키(llm_request_key)별로 나누어 라운드로빈으로 꺼낸다. (한 요청이 대기열을 독점하지 않음)
+    - distributed면 분당 토큰 한도를 Redis 토큰 버킷으로 워커 간에 함께 적용한다. Redis 장애 시 로컬 한도만 적용.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY, tokens_per_minute: int = TOKENS_PER_MINUTE,
+                 distributed: bool = DISTRIBUTED):
+        self.stats = LLMGovernorStats()
+        self._max_concurrency = max_concurrency
+        self._capacity = float(tokens_per_minute)
+        self._distributed = distributed and tokens_per_minute > 0
+        self._tokens = self._capacity
+        self._refilled_at = time.monotonic()
+        self._active = 0
+        self._queues: OrderedDict[str, deque[_Ticket]] = OrderedDict()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._script = None
+        self._redis_retry_at = 0.0
+
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def free_slots(self) -> int:
+        """지금 바로 실행될 수 있는 호출 수 (동시 실행 여유 - 대기열)"""
+        return max(0, self._max_concurrency - self._active - self.queue_depth())
+
+    def snapshot(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "active": self._active,
+            "queue_depth": self.queue_depth(),
+            "queued_requests": len(self._queues),
+            "available_tokens": int(self._tokens) if self._capacity else None,
+        }
+
+    @asynccontextmanager
+    async def aslot(self, estimated_tokens: int) -> AsyncIterator[LLMSlot]:
+        """실행 권한을 얻을 때까지 기다린다. 블록을 벗어나면 동시 실행 자리를 반납한다."""
+        ticket = _Ticket(tokens=estimated_tokens, future=asyncio.get_running_loop().create_future())
+        self._queues.setdefault(llm_request_key.get(), deque()).append(ticket)
+        self._dispatch()
+
+        if not ticket.future.done():
+            self.stats.queued += 1
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.queue_depth())
+
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            if ticket.future.done() and not ticket.future.cancelled():
+                # 자리를 받은 직후 취소된 경우
+                self._release()
+            else:
+                self._remove(ticket)
+            raise
+
+        wait = time.monotonic() - ticket.enqueued_at
+        self.stats.calls += 1
+        self.stats.total_wait_seconds += wait
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, wait)
+
+        slot: LLMSlot | None = None
+        try:
+            if self._distributed:
+                await self._aacquire_remote(estimated_tokens)
+            slot = LLMSlot(self, estimated_tokens)
+            yield slot
+        finally:
+            if slot is not None:
+                slot.close()
+            self._release()
+
+    def account(self, tokens: int) -> None:
+        """동기 호출용. 대기 없이 한도만 차감한다."""
+        self._consume(tokens)
+        self.stats.sync_calls += 1
+        self.stats.tokens_used += tokens
+
+    def _dispatch(self) -> None:
+        """자리가 있고 토큰이 충분한 동안 요청 키를 돌아가며 대기열 맨 앞 호출을 실행시킨다."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._queues and self._active < self._max_concurrency:
+            request_key, queue = next(iter(self._queues.items()))
+            ticket = queue[0]
+
+            need = min(ticket.tokens, self._capacity)
+            if self._capacity and self._available() < need:
+                # 버킷이 다시 찰 때까지 기다린 뒤 재시도
+                delay = (need - self._tokens) / (self._capacity / 60)
+                self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+
+            queue.popleft()
+            if queue:
+                self._queues.move_to_end(request_key)
+            else:
+                del self._queues[request_key]
+
+            self._consume(ticket.tokens)
+            self._active += 1
+            ticket.future.set_result(None)
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._dispatch()
+
+    def _remove(self, ticket: _Ticket) -> None:
+        for request_key, queue in list(self._queues.items()):
+            if ticket in queue:
+                queue.remove(ticket)
+                if not queue:
+                    del self._queues[request_key]
+                break
+        self._dispatch()
+
+    def _available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _consume(self, tokens: int) -> None:
+        if not self._capacity:
+            return
+        self._refill()
+        # 추정치보다 많이 쓴 경우 음수(빚)가 될 수 있고, 이후 호출이 그만큼 더 기다린다
+        self._tokens = min(self._capacity, self._tokens - tokens)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._refilled_at) * self._capacity / 60)
+        self._refilled_at = now
+
+    async def _aacquire_remote(self, tokens: int) -> None:
+        while time.monotonic() >= self._redis_retry_at:
+            try:
+                if self._script is None:
+                    self._script = get_async_redis_client().register_script(TOKEN_BUCKET_SCRIPT)
+                wait_ms = await self._script(keys=[REDIS_KEY], args=[int(self._capacity), tokens])
+            except Exception as e:
+                logger.error(f"LLM 거버너 Redis 오류, {REDIS_RETRY_INTERVAL}초 동안 로컬 한도만 적용: {e}")
+                self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+                return
+
+            if wait_ms == 0:
+                return
+            self.stats.remote_waits += 1
+            await asyncio.sleep(wait_ms / 1000)
+
+
+governor = LLMGovernor()
+
+
+def new_request_key() -> str:
+    """공정 큐 단위를 새로 지정한다. 검색 요청 하나를 시작할 때 호출."""
+    key = uuid.uuid4().hex
+    llm_request_key.set(key)
+    return key
+
+
+def govern(model: Runnable) -> Runnable:
+    """
+    LLM(ChatOpenAI 등)을 거버너를 거쳐 호출하도록 감싼다.
+    비동기 호출은 자리가 날 때까지 대기열에서 기다리고, 동기 호출은 대기 없이 한도만 차감한다.
+    구조화 출력은 with_structured_output(..., include_raw=True)로 넘기면 raw 응답의 사용량으로 보정하고 parsed를 반환한다.
+    (파싱 결과에는 usage_metadata가 없어 보정할 수 없다)
+    """
+
+    def invoke(prompt: Any, config: RunnableConfig) -> Any:
+        governor.account(_estimate_tokens(prompt))
+        try:
+            result, _ = _unwrap(model.invoke(prompt, config))
+            return result
+        except Exception:
+            governor.stats.errors += 1
+            raise
+
+    async def ainvoke(prompt: Any, config: RunnableConfig) -> Any:
+        async with governor.aslot(_estimate_tokens(prompt)) as slot:
+            try:
+                result, usage = _unwrap(await model.ainvoke(prompt, config))
+            except Exception:
+                governor.stats.errors += 1
+                raise
+            if usage:
+                slot.settle(usage["total_tokens"])
+            return result
+
+    return RunnableLambda(invoke, afunc=ainvoke, name=f"governed_{model.get_name()}")
+
+
+def _unwrap(result: Any) -> tuple[Any, dict | None]:
+    """(반환할 결과, 사용량). include_raw=True 구조화 출력이면 parsed를 꺼내고 파싱 오류는 다시 던진다."""
+    if isinstance(result, dict) and "raw" in result and "parsed" in result:
+        if result.get("parsing_error") is not None:
+            raise result["parsing_error"]
+        return result["parsed"], getattr(result["raw"], "usage_metadata", None)
+    return result, getattr(result, "usage_metadata", None)
+
+
+def _estimate_tokens(prompt: Any) -> int:
+    text = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+    return len(text) // CHARS_PER_TOKEN + ESTIMATED_OUTPUT_TOKENS
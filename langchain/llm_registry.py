@@ -0,0 +1,86 @@
+import os
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+
+# ---- OpenAI 클라이언트 설정 (환경변수로 조정 가능) ----
+OPENAI_BASE_URL: str | None = os.getenv("OPENAI_BASE_URL")  # 없으면 SDK 기본값 (로컬 스텁 서버 등으로 대체 가능)
+TIMEOUT: float = float(os.getenv("OPENAI_HTTP_TIMEOUT", "60.0"))
+MAX_CONNECTIONS: int = int(os.getenv("OPENAI_HTTP_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("OPENAI_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+KEEPALIVE_EXPIRY: float = float(os.getenv("OPENAI_HTTP_KEEPALIVE_EXPIRY", "60.0"))
+
+_async_http_client: httpx.AsyncClient | None = None
+_http_client: httpx.Client | None = None
+_chat_models: dict[str, "ChatOpenAI"] = {}
+_embeddings: dict[str, "OpenAIEmbeddings"] = {}
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """모든 OpenAI 비동기 호출(채팅/임베딩)이 공유하는 커넥션 풀"""
+    global _async_http_client
+    if _async_http_client is None or _async_http_client.is_closed:
+        _async_http_client = httpx.AsyncClient(timeout=TIMEOUT, limits=_limits())
+    return _async_http_client
+
+
+def get_http_client() -> httpx.Client:
+    """모든 OpenAI 동기 호출(문서 임베딩 등)이 공유하는 커넥션 풀"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(timeout=TIMEOUT, limits=_limits())
+    return _http_client
+
+
+def get_chat_model(model: str) -> "ChatOpenAI":
+    """
+    모델별로 한 번만 만든 ChatOpenAI를 반환한다.
+    요청마다 클라이언트를 새로 만들지 않고, keep-alive 커넥션(TLS 핸드셰이크 완료)을 재사용한다.
+    """
+    if model not in _chat_models:
+        # LLM SDK import 비용이 커서 서버 시작 경로(lifespan)에서는 import 하지 않는다
+        from langchain_openai import ChatOpenAI
+        _chat_models[model] = ChatOpenAI(
+            model=model,
+            base_url=OPENAI_BASE_URL,
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
+        )
+    return _chat_models[model]
+
+
+def get_embeddings(model: str) -> "OpenAIEmbeddings":
+    """모델별로 한 번만 만든 OpenAIEmbeddings를 반환한다. (채팅 모델과 같은 커넥션 풀 사용)"""
+    if model not in _embeddings:
+        from langchain_openai import OpenAIEmbeddings
+        _embeddings[model] = OpenAIEmbeddings(
+            model=model,
+            base_url=OPENAI_BASE_URL,
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
+        )
+    return _embeddings[model]
+
+
+async def aclose_llm_clients() -> None:
+    """lifespan shutdown에서 호출하여 커넥션 풀을 정리한다."""
+    global _async_http_client, _http_client
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+    _chat_models.clear()
+    _embeddings.clear()
@@ -42,6 +42,42 @@ search_query_prompt = """
         Return only the GitHub Search question string.
         """
 
+# 번역 + 검색 쿼리 생성을 LLM 호출 한 번으로 처리 (QUERY_CHAIN_MODE=single_call)
+translate_search_query_prompt = """
+        Current Date: {{ current_date }}
+        You are a GitHub search expert who converts natural language requests into valid GitHub Search API queries.
+
+        Your task:
+        - Read the user’s natural language request (`question`). It may be written in any language (usually Korean).
+        - First understand its intent in English; use English terms for keywords, topics, and labels in the query.
+        - Refer to the provided `context`, which explains how GitHub search qualifiers (e.g., stars, language, good-first-issues, label, topic, repo, sort) are used.
+        {% if languages and languages|length > 0 -%}
+        - Use the user’s selected `languages` list to include language filters where appropriate.
+          For example:
+            - language:javascript
+            - language:"regular expression"
+        {%- endif %}
+
+        ### Rules
+        1) If a qualifier schema contains one or more spaces, wrap the entire schema in double quotes (" ").
+           - Examples: label:"in progress", topic:"machine learning"
+        2) GitHub search is case-insensitive; prefer lowercase for consistency.
+        3) Follow the syntax and examples described in the provided `context`.
+        4) Output only a single GitHub search question string (no explanations).
+        5) If intent is unclear, infer the most likely goal using the context.
+        6) Do not include words about the act of searching (e.g., "search", "find", "look for") as keywords.
+
+        ### Inputs
+        - question: {{ question }}
+        - context: {{ context }}
+        {% if languages and languages|length > 0 -%}
+        - languages: {{ languages }}
+        {%- endif %}
+
+        ### Output
+        Return only the GitHub Search question string.
+        """
+
 simple_summary_prompt = """
     You are a GitHub repository summarizer.
 
@@ -0,0 +1,221 @@
+"""
+생성된 GitHub 검색 쿼리의 의미 기반(semantic) 캐시.
+표현만 다른 같은 의도의 질문("python web framework", "웹 프레임워크 파이썬")은 번역/쿼리 생성 LLM 호출 없이
+이전에 생성한 쿼리를 재사용한다.
+- 질문 임베딩을 선택 언어 집합별로 나눈 프로세스 내부 numpy 인덱스에 보관하고,
+  가장 가까운 질문의 코사인 유사도가 THRESHOLD 이상이면 그 쿼리를 쓴다.
+- 프롬프트에 현재 날짜가 들어가므로 TTL이 지나거나 날짜가 바뀐 항목은 버린다.
+- 전체 항목 수가 MAX_TOTAL_ENTRIES를 넘으면 가장 오래 쓰이지 않은 언어 집합부터 통째로 버린다.
+- 임베딩 실패 시에는 캐시 없이 쿼리를 생성한다.
+"""
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Awaitable, Callable
+
+import numpy as np
+from fastapi.logger import logger
+from langchain_core.embeddings import Embeddings
+
+from common.stage_timer import stage
+
+# ---- 검색 쿼리 의미 캐시 설정 (환경변수로 조정 가능) ----
+CACHE_ENABLED: bool = os.getenv("SEMANTIC_QUERY_CACHE_ENABLED", "true").lower() == "true"
+THRESHOLD: float = float(os.getenv("SEMANTIC_QUERY_CACHE_THRESHOLD", "0.92"))  # 코사인 유사도
+CACHE_TTL: int = int(os.getenv("SEMANTIC_QUERY_CACHE_TTL_SECONDS", str(60 * 60 * 6)))  # 6시간
+MAX_ENTRIES: int = int(os.getenv("SEMANTIC_QUERY_CACHE_MAX_ENTRIES", "1000"))  # 언어 집합별
+MAX_TOTAL_ENTRIES: int = int(os.getenv("SEMANTIC_QUERY_CACHE_MAX_TOTAL_ENTRIES", "2000"))  # 전체 (항목당 약 12KB)
+EMBEDDING_MODEL = "text-embedding-3-large"  # 검색 한정자 스토어와 같은 모델 (질의 임베딩 캐시 공유)
+
+
+@dataclass
+class SemanticQueryCacheStats:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+stats = SemanticQueryCacheStats()
+
+
+@dataclass
+class _Entry:
+    question: str
+    query: str
+
+
+class _Partition:
+    """
+    한 언어 집합의 인덱스. 슬롯 i에 vectors[i](정규화된 질문 임베딩), expires_at[i], entries[i]를 둔다.
+    - 행렬은 미리 잡아 두고 부족할 때만 두 배로 늘린다. (추가할 때마다 전체를 복사하지 않음)
+    - 만료된 슬롯은 비워 두었다가 재사용하고, max_entries가 다 차면 가장 먼저 만료될(=가장 오래된) 슬롯을 덮어쓴다.
+    빈 슬롯은 expires_at이 0이다.
+    """
+
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, dimension: int):
+        self.vectors = np.zeros((0, dimension), dtype=np.float32)
+        self.expires_at = np.zeros(0, dtype=np.float64)
+        self.entries: list[_Entry | None] = []
+        self.size = 0
+
+    def evict_expired(self, now: float) -> None:
+        expired = np.flatnonzero((self.expires_at > 0) & (self.expires_at <= now))
+        for index in expired:
+            self.entries[index] = None
+        self.expires_at[expired] = 0
+        self.size -= len(expired)
+
+    def nearest(self, vector: np.ndarray, now: float) -> tuple[_Entry, float] | None:
+        if self.size == 0:
+            return None
+        scores = self.vectors @ vector
+        scores[self.expires_at <= now] = -np.inf
+        index = int(np.argmax(scores))
+        if scores[index] == -np.inf:
+            return None
+        return self.entries[index], float(scores[index])
+
+    def add(self, vector: np.ndarray, entry: _Entry, expires_at: float, max_entries: int) -> None:
+        empty = np.flatnonzero(self.expires_at == 0)
+        if len(empty):
+            index = int(empty[0])
+        elif len(self.entries) < max_entries:
+            index = len(self.entries)
+            self._grow(min(max_entries, max(self.INITIAL_CAPACITY, len(self.entries) * 2)))
+        else:
+            # 가장 오래된 항목 자리에 덮어쓴다
+            index = int(np.argmin(self.expires_at))
+            self.size -= 1
+
+        self.vectors[index] = vector
+        self.expires_at[index] = expires_at
+        self.entries[index] = entry
+        self.size += 1
+
+    def _grow(self, capacity: int) -> None:
+        vectors = np.zeros((capacity, self.vectors.shape[1]), dtype=np.float32)
+        vectors[:len(self.entries)] = self.vectors
+        expires_at = np.zeros(capacity, dtype=np.float64)
+        expires_at[:len(self.entries)] = self.expires_at
+        self.vectors = vectors
+        self.expires_at = expires_at
+        self.entries.extend([None] * (capacity - len(self.entries)))
+
+
+class SemanticQueryCache:
+    def __init__(
+        self,
+        embedding: Embeddings,
+        threshold: float = THRESHOLD,
+        ttl: int = CACHE_TTL,
+        max_entries: int = MAX_ENTRIES,
+        max_total_entries: int = MAX_TOTAL_ENTRIES,
+    ):
+        self._embedding = embedding
+        self._threshold = threshold
+        self._ttl = ttl
+        self._max_entries = min(max_entries, max_total_entries)
+        self._max_total_entries = max_total_entries
+        # 언어 집합 -> 인덱스 (최근에 쓴 순서, LRU)
+        self._partitions: OrderedDict[tuple[str, ...], _Partition] = OrderedDict()
+        self._today = date.today()
+
+    def get_or_generate(self, question: str, languages: list, generate: Callable[[], str]) -> str:
+        try:
+            with stage("semantic_query_cache", log=False):
+                vector = _normalize(self._embedding.embed_query(question))
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"검색 쿼리 캐시 임베딩 실패: {e}")
+            return generate()
+
+        cached = self._lookup(question, languages, vector)
+        if cached is not None:
+            return cached
+        query = generate()
+        self._store(question, languages, vector, query)
+        return query
+
+    async def aget_or_generate(self, question: str, languages: list, generate: Callable[[], Awaitable[str]]) -> str:
+        """임베딩 -> 언어 집합 인덱스에서 최근접 질문 조회 -> 없으면 쿼리 생성 후 저장"""
+        try:
+            with stage("semantic_query_cache", log=False):
+                vector = _normalize(await self._embedding.aembed_query(question))
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"검색 쿼리 캐시 임베딩 실패: {e}")
+            return await generate()
+
+        cached = self._lookup(question, languages, vector)
+        if cached is not None:
+            return cached
+        query = await generate()
+        self._store(question, languages, vector, query)
+        return query
+
+    def total_entries(self) -> int:
+        return sum(partition.size for partition in self._partitions.values())
+
+    def _lookup(self, question: str, languages: list, vector: np.ndarray) -> str | None:
+        self._clear_if_date_changed()
+        key = _partition_key(languages)
+        partition = self._partitions.get(key)
+        if partition is not None:
+            self._partitions.move_to_end(key)
+            found = partition.nearest(vector, time.time())
+            if found is not None and found[1] >= self._threshold:
+                entry, score = found
+                stats.hits += 1
+                logger.info(f"검색 쿼리 캐시 적중: '{question}' ~ '{entry.question}' (유사도 {score:.3f})")
+                return entry.query
+        stats.misses += 1
+        return None
+
+    def _store(self, question: str, languages: list, vector: np.ndarray, query: str) -> None:
+        self._clear_if_date_changed()
+        now = time.time()
+        self._evict_expired(now)
+
+        key = _partition_key(languages)
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = _Partition(len(vector))
+        self._partitions.move_to_end(key)
+        partition.add(vector, _Entry(question=question, query=query), now + self._ttl, self._max_entries)
+
+        # 전체 한도를 넘으면 가장 오래 쓰이지 않은 언어 집합부터 버린다
+        while self.total_entries() > self._max_total_entries and len(self._partitions) > 1:
+            self._partitions.popitem(last=False)
+
+    def _evict_expired(self, now: float) -> None:
+        """모든 언어 집합에서 만료 항목을 지우고, 비게 된 언어 집합은 삭제한다."""
+        for key in list(self._partitions):
+            partition = self._partitions[key]
+            partition.evict_expired(now)
+            if partition.size == 0:
+                del self._partitions[key]
+
+    def _clear_if_date_changed(self) -> None:
+        today = date.today()
+        if today != self._today:
+            self._partitions.clear()
+            self._today = today
+
+
+def _partition_key(languages: list) -> tuple[str, ...]:
+    """언어 순서/대소문자와 무관하게 같은 언어 집합이면 같은 인덱스"""
+    return tuple(sorted({language.lower() for language in languages or []}))
+
+
+def _normalize(vector: list[float]) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm else array
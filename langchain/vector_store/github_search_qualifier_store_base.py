@@ -7,4 +7,9 @@ class GithubSearchQualifierStoreBase(ABC):
     @abstractmethod
     def get_retriever(self, top_k: int):
         """검색기 리트리버 객체 반환"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def refresh_documents(self):
+        """GitHub 검색 문서를 다시 읽어 저장된 벡터를 갱신 (스케줄러에서 호출)"""
+        pass
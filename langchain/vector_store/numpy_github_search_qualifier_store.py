@@ -0,0 +1,166 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from fastapi.logger import logger
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun, CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.retrievers import BaseRetriever
+from langchain_text_splitters import MarkdownHeaderTextSplitter
+
+from github.web_docs_loader import fetch_github_docs
+from langchain.embedding.cached_embeddings import with_query_cache
+from langchain.llm_registry import get_embeddings
+from langchain.vector_store.github_search_qualifier_store_base import GithubSearchQualifierStoreBase
+
+REPOSITORIES_SEARCH_DOCS_URL = "https://docs.github.com/en/search-github/searching-on-github/searching-for-repositories"
+HEADERS_TO_SPLIT_ON = [("##", "Topic")]
+EMBEDDING_MODEL = "text-embedding-3-large"
+
+PROJECT_ROOT = Path(__file__).resolve().parents[0]  # langchain/vector_store
+SNAPSHOT_DIR = Path(os.getenv("NUMPY_QUALIFIER_STORE_DIR", PROJECT_ROOT / "data" / "numpy_qualifier_store"))
+MATRIX_FILE = "embeddings.npy"
+DOCUMENTS_FILE = "documents.json"
+META_FILE = "meta.json"
+DIMENSION_PROBE = "github"  # 현재 임베딩 차원 확인용 질의 (질의 임베딩 캐시에 남음)
+
+
+class NumpyGithubSearchQualifierStore(GithubSearchQualifierStoreBase):
+    """
+    프로세스 내부 벡터 스토어.
+    검색 한정자 문서는 수십 개 청크뿐이므로 임베딩을 연속된 NumPy 행렬 하나에 두고
+    행렬-벡터 곱 한 번으로 정확한 코사인 top-k를 계산한다. (외부 벡터 DB 네트워크 왕복 없음)
+    임베딩은 디스크 스냅샷으로 저장하고, 재시작 시 memory-map으로 불러온다.
+    스냅샷의 임베딩 모델/차원이 현재 설정과 다르면 버리고 다시 만든다.
+    """
+
+    def __init__(
+        self,
+        embedding: Embeddings | None = None,
+        snapshot_dir: Path = SNAPSHOT_DIR,
+        embedding_model: str = EMBEDDING_MODEL,
+    ):
+        if embedding is None:
+            embedding = with_query_cache(get_embeddings(embedding_model), embedding_model)
+
+        self.embedding = embedding
+        self._embedding_model = embedding_model
+        self._snapshot_dir = Path(snapshot_dir)
+        self._matrix: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self._documents: list[Document] = []
+
+        # 스냅샷이 없으면 문서를 가져와 임베딩 후 저장
+        if not self._load_snapshot():
+            self._save_documents()
+
+    def get_retriever(self, top_k: int):
+        return NumpyQualifierRetriever(store=self, top_k=top_k)
+
+    def refresh_documents(self):
+        """
+        GitHub 검색 문서를 다시 읽어 임베딩 행렬을 새로 만든 뒤 한 번에 교체한다.
+        (교체 전까지는 기존 행렬로 계속 검색 가능)
+        """
+        self._save_documents()
+
+    def similarity_search_by_vector(self, query_vector: list[float], k: int) -> list[Document]:
+        """정규화된 임베딩 행렬과의 내적(=코사인 유사도) 기준 상위 k개 문서"""
+        matrix, documents = self._matrix, self._documents
+        if not documents:
+            return []
+
+        query = _normalize(np.asarray(query_vector, dtype=np.float32))
+        scores = matrix @ query
+
+        k = min(k, len(documents))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [documents[i] for i in top]
+
+    def _save_documents(self):
+        documents = self._load_search_docs()
+        vectors = self.embedding.embed_documents([doc.page_content for doc in documents])
+        matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+
+        self._write_snapshot(matrix, documents)
+        # 참조를 한 번에 바꿔 검색 중인 요청이 중간 상태를 보지 않도록 한다
+        self._matrix, self._documents = matrix, documents
+
+    def _load_snapshot(self) -> bool:
+        matrix_path = self._snapshot_dir / MATRIX_FILE
+        documents_path = self._snapshot_dir / DOCUMENTS_FILE
+        meta_path = self._snapshot_dir / META_FILE
+        if not matrix_path.exists() or not documents_path.exists() or not meta_path.exists():
+            return False
+
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("embedding_model") != self._embedding_model:
+            logger.info(f"스냅샷 임베딩 모델이 다름 ({meta.get('embedding_model')} != {self._embedding_model}), 다시 생성")
+            return False
+
+        matrix = np.load(matrix_path, mmap_mode="r")
+        # 같은 모델이라도 차원 설정(dimensions)이 바뀌었을 수 있으므로 실제 질의 임베딩 차원과 비교
+        dimension = len(self.embedding.embed_query(DIMENSION_PROBE))
+        if matrix.ndim != 2 or matrix.shape[1] != dimension or meta.get("dimension") != dimension:
+            logger.info(f"스냅샷 임베딩 차원이 다름 ({matrix.shape} != (*, {dimension})), 다시 생성")
+            return False
+
+        raw_documents = json.loads(documents_path.read_text(encoding="utf-8"))
+        self._documents = [Document(page_content=d["page_content"], metadata=d["metadata"]) for d in raw_documents]
+        self._matrix = matrix
+        return True
+
+    def _write_snapshot(self, matrix: np.ndarray, documents: list[Document]):
+        self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+        matrix_path = self._snapshot_dir / MATRIX_FILE
+        documents_path = self._snapshot_dir / DOCUMENTS_FILE
+
+        # 임시 파일에 쓴 뒤 교체하여 중간에 실패해도 기존 스냅샷이 깨지지 않도록 한다
+        tmp_matrix_path = matrix_path.with_suffix(".tmp.npy")
+        np.save(tmp_matrix_path, matrix)
+        tmp_documents_path = documents_path.with_suffix(".tmp")
+        tmp_documents_path.write_text(
+            json.dumps([{"page_content": d.page_content, "metadata": d.metadata} for d in documents], ensure_ascii=False),
+            encoding="utf-8",
+        )
+        tmp_meta_path = (self._snapshot_dir / META_FILE).with_suffix(".tmp")
+        tmp_meta_path.write_text(
+            json.dumps({"embedding_model": self._embedding_model, "dimension": int(matrix.shape[1])}),
+            encoding="utf-8",
+        )
+        # 메타데이터를 먼저 지우고 마지막에 쓴다 (중간에 실패하면 다음 시작 때 다시 생성)
+        (self._snapshot_dir / META_FILE).unlink(missing_ok=True)
+        os.replace(tmp_matrix_path, matrix_path)
+        os.replace(tmp_documents_path, documents_path)
+        os.replace(tmp_meta_path, self._snapshot_dir / META_FILE)
+
+    @staticmethod
+    def _load_search_docs():
+        md_text = fetch_github_docs(REPOSITORIES_SEARCH_DOCS_URL)
+        splitter = MarkdownHeaderTextSplitter(headers_to_split_on=HEADERS_TO_SPLIT_ON, strip_headers=False)
+        return splitter.split_text(md_text)
+
+
+class NumpyQualifierRetriever(BaseRetriever):
+    """NumpyGithubSearchQualifierStore용 리트리버"""
+    store: Any
+    top_k: int = 5
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> list[Document]:
+        vector = self.store.embedding.embed_query(query)
+        return self.store.similarity_search_by_vector(vector, self.top_k)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        vector = await self.store.embedding.aembed_query(query)
+        return self.store.similarity_search_by_vector(vector, self.top_k)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """코사인 유사도를 내적으로 계산할 수 있도록 L2 정규화"""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
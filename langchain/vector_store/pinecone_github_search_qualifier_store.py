@@ -1,19 +1,24 @@
+import hashlib
+import json
 import os
 from abc import ABC
-from uuid import uuid4
 from dotenv import load_dotenv
+from fastapi.logger import logger
+from langchain_core.documents import Document
 from langchain_text_splitters import MarkdownHeaderTextSplitter
 
 from pinecone import Pinecone, ServerlessSpec
 from langchain_pinecone import PineconeVectorStore
 
-from langchain_openai import OpenAIEmbeddings
+from langchain.embedding.cached_embeddings import with_query_cache
+from langchain.llm_registry import get_embeddings
 from langchain.vector_store.github_search_qualifier_store_base import GithubSearchQualifierStoreBase
 
-from github.web_docs_loader import fetch_github_docs
+from github.web_docs_loader import fetch_github_docs, fetch_github_docs_if_modified
 
 REPOSITORIES_SEARCH_DOCS_URL = "https://docs.github.com/en/search-github/searching-on-github/searching-for-repositories"
 HEADERS_TO_SPLIT_ON = [("##", "Topic")]
+EMBEDDING_MODEL = "text-embedding-3-large"
 
 load_dotenv()
 
@@ -24,7 +29,10 @@ class PineconeGithubSearchQualifierStore(GithubSearchQualifierStoreBase, ABC):
         self._index_name = index_name
         self._namespace = namespace
         self.pinecone_client = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-        self.embedding = OpenAIEmbeddings(model="text-embedding-3-large")
+        self.embedding = with_query_cache(get_embeddings(EMBEDDING_MODEL), EMBEDDING_MODEL)
+        # 검색 문서 페이지 조건부 요청용 검증자
+        self._docs_etag: str | None = None
+        self._docs_last_modified: str | None = None
 
         # 벡터 스토어 초기화
         self._store = self._initialize(index_name, namespace, dim, metric)
@@ -32,6 +40,7 @@ class PineconeGithubSearchQualifierStore(GithubSearchQualifierStoreBase, ABC):
     def _initialize(self, index_name: str, namespace: str, dim: int, metric: str):
 
         # 인덱스 존재 여부 확인 후 존재하지 않는 경우에만 생성 및 저장
+        created = False
         if not self.pinecone_client.has_index(index_name):
             self.pinecone_client.create_index(
                 name=index_name,
@@ -39,34 +48,73 @@ class PineconeGithubSearchQualifierStore(GithubSearchQualifierStoreBase, ABC):
                 dimension=dim,
                 metric=metric,
             )
-            self._save_documents()
+            created = True
 
-        index = self.pinecone_client.Index(index_name)
-        return PineconeVectorStore(index=index, embedding=self.embedding, namespace=namespace)
+        self._index = self.pinecone_client.Index(index_name)
+        store = PineconeVectorStore(index=self._index, embedding=self.embedding, namespace=namespace)
+        if created:
+            self._sync_documents(store, self._load_search_docs())
+        return store
 
     def get_retriever(self, top_k: int):
         return self._store.as_retriever(search_kwargs={"k": top_k})
 
-    def _save_documents(self):
-        repo_docs = self._load_search_docs()
-        uuids = [str(uuid4()) for _ in range(len(repo_docs))]
-        self._store.add_documents(documents=repo_docs, ids=uuids)
-
     def refresh_documents(self):
         """
-        문서가 업데이트되는 것을 대비하여
-        GitHub 검색 문서를 다시 읽어서
-        현재 namespace의 벡터들을 모두 삭제하고 새로 저장한다.
+        문서가 업데이트되는 것을 대비하여 GitHub 검색 문서를 다시 읽어
+        현재 namespace의 벡터와 비교 후 바뀐 부분만 반영한다.
         (하루 1번 스케줄링해서 호출하는 용도)
+        - 페이지가 바뀌지 않았으면(304) 아무것도 하지 않는다.
+        - 추가/변경된 청크만 임베딩하고, 사라진 청크만 삭제한다.
+        - 추가를 먼저 하고 삭제를 나중에 하므로 검색 결과가 비는 구간이 없다.
         """
-        # 1) 현재 namespace의 모든 벡터 삭제
-        self._store.delete(delete_all=True, namespace=self._namespace)
-
-        # 2) 새 문서 저장
-        self._save_documents()
+        page = fetch_github_docs_if_modified(
+            REPOSITORIES_SEARCH_DOCS_URL,
+            etag=self._docs_etag,
+            last_modified=self._docs_last_modified,
+        )
+        if page.text is None:
+            logger.info("검색 한정자 문서 변경 없음 (304), 갱신 생략")
+            return
+
+        self._sync_documents(self._store, self._split_docs(page.text))
+        self._docs_etag, self._docs_last_modified = page.etag, page.last_modified
+
+    def _sync_documents(self, store: PineconeVectorStore, docs: list[Document]):
+        """내용 해시 ID 기준으로 저장된 벡터 목록(manifest)과 비교하여 차이만 반영"""
+        docs_by_id = {_document_id(doc): doc for doc in docs}
+        stored_ids = self._list_stored_ids()
+
+        added_ids = [doc_id for doc_id in docs_by_id if doc_id not in stored_ids]
+        removed_ids = [doc_id for doc_id in stored_ids if doc_id not in docs_by_id]
+
+        # 1) 추가/변경된 청크만 임베딩 후 저장
+        if added_ids:
+            store.add_documents(documents=[docs_by_id[doc_id] for doc_id in added_ids], ids=added_ids)
+
+        # 2) 더 이상 없는 청크만 삭제
+        if removed_ids:
+            store.delete(ids=removed_ids, namespace=self._namespace)
+
+        logger.info(f"검색 한정자 문서 동기화: 추가 {len(added_ids)}건, 삭제 {len(removed_ids)}건, 유지 {len(docs_by_id) - len(added_ids)}건")
+
+    def _list_stored_ids(self) -> set[str]:
+        stored_ids: set[str] = set()
+        for ids in self._index.list(namespace=self._namespace):
+            stored_ids.update(ids)
+        return stored_ids
+
+    @classmethod
+    def _load_search_docs(cls):
+        return cls._split_docs(fetch_github_docs(REPOSITORIES_SEARCH_DOCS_URL))
 
     @staticmethod
-    def _load_search_docs():
-        md_text = fetch_github_docs(REPOSITORIES_SEARCH_DOCS_URL)
+    def _split_docs(md_text: str) -> list[Document]:
         splitter = MarkdownHeaderTextSplitter(headers_to_split_on=HEADERS_TO_SPLIT_ON, strip_headers=False)
-        return splitter.split_text(md_text)
\ No newline at end of file
+        return splitter.split_text(md_text)
+
+
+def _document_id(doc: Document) -> str:
+    """청크 내용 + 메타데이터로 만든 결정적 ID (내용이 같으면 항상 같은 ID)"""
+    payload = json.dumps([doc.page_content, doc.metadata], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,21 @@
+import os
+from functools import cache
+
+from langchain.vector_store.github_search_qualifier_store_base import GithubSearchQualifierStoreBase
+
+# 검색 한정자 벡터 스토어 종류: "pinecone" (외부 벡터 DB) | "numpy" (프로세스 내부)
+QUALIFIER_STORE: str = os.getenv("QUALIFIER_STORE", "pinecone").lower()
+
+
+@cache
+def get_qualifier_store() -> GithubSearchQualifierStoreBase:
+    """
+    QUALIFIER_STORE 설정에 맞는 벡터 스토어를 만든다. (사용하지 않는 쪽 의존성은 import하지 않음)
+    검색 서비스와 갱신 스케줄러가 같은 인스턴스를 공유하도록 한 번만 생성한다.
+    """
+    if QUALIFIER_STORE == "numpy":
+        from langchain.vector_store.numpy_github_search_qualifier_store import NumpyGithubSearchQualifierStore
+        return NumpyGithubSearchQualifierStore()
+
+    from langchain.vector_store.pinecone_github_search_qualifier_store import PineconeGithubSearchQualifierStore
+    return PineconeGithubSearchQualifierStore()
@@ -1,12 +1,16 @@
 from apscheduler.schedulers.background import BackgroundScheduler
-from langchain.vector_store.pinecone_github_search_qualifier_store import PineconeGithubSearchQualifierStore
-
-store = PineconeGithubSearchQualifierStore()
+from langchain.vector_store.qualifier_store_factory import get_qualifier_store
 
 scheduler = BackgroundScheduler()
 
+
+def _refresh_documents():
+    # 스토어는 import 시점이 아니라 실행 시점에 가져온다 (서비스와 같은 인스턴스 공유)
+    get_qualifier_store().refresh_documents()
+
+
 # 하루에 한 번 실행 (매 24시간)
-scheduler.add_job(store.refresh_documents, "interval", hours=24)
+scheduler.add_job(_refresh_documents, "interval", hours=24)
 
 def start_scheduler():
     scheduler.start()
\ No newline at end of file
@@ -1,16 +1,24 @@
+from dataclasses import asdict
 from typing import Annotated
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.params import Query
+from fastapi.responses import StreamingResponse
 
+from schema.github_rate_limit_resp import GithubRateLimitResp
+from schema.readiness_resp import ReadinessResp
 from schema.repo_search_req import RepoSearchReq
 from schema.repo_lanaguages_search_resp import RepoLanguagesSearchResp
 from schema.wrapping_searching_response import WrappingSearchingResponse
 
-from service.github_search_service import search
-from github.languages import find_languages_list_by_query
+from service.github_search_service import search, search_stream
+from service.search_result_cache import search_cache_status
+from github.languages import afind_languages_list_by_query
+from github.rate_limit_scheduler import get_scheduler
 
+from common import metrics
+from common.config import resources
 from common.config.app_setup import setup_app
 from common.config.lifespan import lifespan
 
@@ -24,18 +32,62 @@ app = FastAPI(lifespan=lifespan)
 setup_app(app)
 
 
+@app.get(
+    path="/ready",
+    description='준비 상태 확인(readiness probe). 초기화가 끝나기 전에는 503',
+    response_model=ReadinessResp,
+)
+async def ready(response: Response):
+    status, steps, error = resources.readiness()
+    if status != "ready":
+        response.status_code = 503
+    return ReadinessResp(status=status, steps=steps, error=error)
+
+
+@app.get(path="/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    content, media_type = metrics.render_metrics()
+    return Response(content=content, media_type=media_type)
+
+
+@app.get(
+    path="/github/rate-limit",
+    description='GitHub API 토큰/리소스별 남은 rate limit 한도와 스케줄러 통계',
+    response_model=GithubRateLimitResp,
+)
+async def github_rate_limit():
+    scheduler = get_scheduler()
+    return GithubRateLimitResp(budgets=scheduler.snapshot(), **asdict(scheduler.stats))
+
+
 @app.post("/api/v1/repositories/search", response_model=WrappingSearchingResponse)
-async def search_repository(request: RepoSearchReq):
+async def search_repository(request: RepoSearchReq, response: Response):
     # 검색
     results = await search(request.keyword, request.languages)
+    response.headers["X-Cache"] = search_cache_status.get() # 캐시 HIT/STALE/MISS 여부
     return WrappingSearchingResponse(results=results)
 
 
+@app.post(
+    path="/api/v1/repositories/search/stream",
+    description='검색 결과를 NDJSON으로 스트리밍. 리포지토리 목록을 먼저 보내고 요약은 완료되는 대로 전송',
+)
+async def search_repository_stream(request: RepoSearchReq):
+    # 언어 검증은 스트림 시작 전에 수행 (실패 시 422)
+    events = await search_stream(request.keyword, request.languages)
+
+    async def ndjson():
+        async for event in events:
+            yield event.model_dump_json(exclude_none=True) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @app.get(
     path="/api/v1/repositories/languages/search",
     description='깃허브 리포지토리 검색 시 지원되는 언어 목록 중에서 특정 단어가 포함되는 언어 목록을 검색',
     response_model=RepoLanguagesSearchResp,
 )
-def search_repository_languages_list(query: Annotated[str, Query(min_length=1)]):
-    results = find_languages_list_by_query(query)
+async def search_repository_languages_list(query: Annotated[str, Query(min_length=1)]):
+    results = await afind_languages_list_by_query(query)
     return RepoLanguagesSearchResp(results=results)
\ No newline at end of file
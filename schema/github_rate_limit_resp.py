@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class GithubRateLimitBudget(BaseModel):
+    token: int # 토큰 풀 내 순번 (토큰 값은 노출하지 않음)
+    resource: str # core | search | graphql
+    limit: int | None # 시간당 한도
+    remaining: int | None # 남은 요청 수 (첫 응답 전에는 null)
+    reset_in: float # 한도 초기화까지 남은 시간(초)
+    blocked_for: float # secondary rate limit으로 막힌 남은 시간(초)
+    inflight: int # 응답 대기 중인 요청 수
+
+
+class GithubRateLimitResp(BaseModel):
+    budgets: list[GithubRateLimitBudget] # 토큰/리소스별 한도 상태
+    requests: int # 스케줄러를 거친 요청 수
+    throttled_waits: int # 한도 부족으로 대기한 횟수
+    rate_limited_responses: int # 403/429 rate limit 응답 수
+    rejected: int # 대기 한도 초과로 거절한 횟수
@@ -0,0 +1,9 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class ReadinessResp(BaseModel):
+    status: Literal["initializing", "ready", "failed"] # 초기화 상태
+    steps: dict[str, float] # 초기화 단계별 소요 시간(초)
+    error: str | None = None # 초기화 실패 사유
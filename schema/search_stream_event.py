@@ -0,0 +1,14 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+from schema.repo_search_resp import RepoSearchResp
+
+
+class SearchStreamEvent(BaseModel):
+    """스트리밍 검색 응답의 한 줄(NDJSON)"""
+    type: Literal["repositories", "summary", "error", "done"] # 이벤트 종류
+    results: list[RepoSearchResp] | None = None # repositories: 요약 없는 리포지토리 목록
+    index: int | None = None # summary: results 내 리포지토리 위치
+    function_summary: list[str] | None = None # summary: 리포지토리 기능 요약
+    detail: str | None = None # error: 오류 메시지
@@ -0,0 +1,48 @@
+"""
+앱 import 시간 분석 리포트.
+`python -X importtime` 으로 main 모듈을 import 하고, 누적 시간이 큰 모듈 순으로 출력한다.
+
+사용법: python scripts/import_time_report.py [--top 30] [--module main]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=30, help="출력할 모듈 수")
+    parser.add_argument("--module", default="main", help="import 할 모듈")
+    args = parser.parse_args()
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {args.module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    # 형식: "import time: self [us] | cumulative | imported package"
+    rows: list[tuple[int, int, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        sys.exit(result.returncode)
+
+    total_us = max((cumulative for cumulative, _, _ in rows), default=0)
+    print(f"import {args.module}: 총 {total_us / 1000:.1f}ms")
+    print(f"{'cumulative(ms)':>15} {'self(ms)':>10}  module")
+    for cumulative, self_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{cumulative / 1000:>15.1f} {self_us / 1000:>10.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
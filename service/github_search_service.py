@@ -1,25 +1,36 @@
 import asyncio
-import time
+import os
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable
 
 from dotenv import load_dotenv
 from fastapi.logger import logger
-from pydantic import HttpUrl
+from pydantic import TypeAdapter
 
-from github.languages import validate_support
-from langchain.chain.github_search_query_chain import GithubSearchQueryChain
-from langchain.chain.simple_github_repository_summary_chain import SimpleGithubRepositorySummaryChain
-from langchain.vector_store.pinecone_github_search_qualifier_store import PineconeGithubSearchQualifierStore
+from common.config import resources
+from common.stage_timer import stage
+from github.languages import avalidate_support
+from langchain import llm_governor
 from schema.repo_search_resp import RepoSearchResp
 from schema.repo_summary_dto import RepositorySummaryDTO
+from schema.search_stream_event import SearchStreamEvent
 from schema.langauage_ratio import LanguageRatio
 from schema.order_by import OrderBy
 from schema.sort_by import SortBy
 
-from github.search_results_loader import load_search_results
-from github.repository_languages_loader import load_repository_languages
+from github.search_results_loader import aload_search_results
+from github.repository_languages_loader import prepare_languages_loaders
+from service import search_result_cache, single_flight, summary_cache
+from service.summary_batcher import SummaryBatcher
+
+# 검색 요청 하나에서 동시에 실행할 외부 호출(언어 조회/요약) 수
+PIPELINE_CONCURRENCY: int = int(os.getenv("SEARCH_PIPELINE_CONCURRENCY", "10"))
+# 요약 방식: fanout(리포지토리마다 호출) | batched(여러 리포지토리를 한 번에 호출) | auto(LLM 여유에 따라 선택)
+SUMMARY_MODE: str = os.getenv("SUMMARY_MODE", "auto").lower()
+
+# 워커 간 결과 전달용 직렬화
+_search_results_adapter = TypeAdapter(list[RepoSearchResp])
 
-_store = PineconeGithubSearchQualifierStore()
-_query_chain = GithubSearchQueryChain(_store)
 
 async def search(
     question: str,
@@ -30,96 +41,303 @@ async def search(
 ) -> list[RepoSearchResp]:
     """
     GitHub 검색 + 언어 비율 조회 + LLM 요약을 실행하는 일종의 어셈블러 함수
+    동일한 검색 조건의 결과는 Redis 캐시(search_result_cache)에서 바로 반환한다.
     """
+    if languages is None:
+        languages = []
 
     # 지원 가능한 언어인지 검증
-    validate_support(languages)
+    await avalidate_support(languages)
 
+    cache_key = search_result_cache.build_cache_key(
+        question=question,
+        languages=languages,
+        sort=sort.value,
+        order=order.value,
+        per_page=per_page,
+    )
+    async def asearch_and_store() -> list[RepoSearchResp]:
+        results = await _search_uncached(question, languages, sort, order, per_page)
+        await search_result_cache.astore(cache_key, results)
+        return results
+
+    # 캐시에 없으면 동일한 검색이 동시에 여러 번 들어와도 파이프라인은 한 번만 실행 (single-flight)
+    # 캐시 저장도 계산한 쪽(리더)에서 한 번만 한다
+    with stage("search"):
+        return await search_result_cache.aget_or_compute(
+            cache_key,
+            lambda: single_flight.ado(
+                cache_key,
+                asearch_and_store,
+                encode=_search_results_adapter.dump_json,
+                decode=_search_results_adapter.validate_json,
+            ),
+        )
+
+
+async def search_stream(
+    question: str,
+    languages: list[str] | None = None,
+    sort: SortBy = SortBy.STARS,
+    order: OrderBy = OrderBy.DESC,
+    per_page: int = 5,
+) -> AsyncIterator[SearchStreamEvent]:
+    """
+    search()의 스트리밍 버전.
+    언어 검증은 스트림 시작 전에 끝내고(422 응답 가능), 이벤트 제너레이터를 반환한다.
+    - repositories: GitHub 단계 직후 요약 없는 리포지토리 목록
+    - summary: 리포지토리별 요약이 끝나는 대로 (index 기준)
+    - done: 모든 요약 완료
+    """
     if languages is None:
         languages = []
 
-    # 1. Search Query 생성
-    start = time.perf_counter()
-    search_query = _build_search_query(question=question, languages=languages)
-    elapsed = time.perf_counter() - start
-    logger.info(f"Search Query 생성 실행 시간: {elapsed:.4f}초")
-    logger.info(f"생성된 Search Query: {search_query}")
+    # 지원 가능한 언어인지 검증
+    await avalidate_support(languages)
 
-    # 2. 검색 API 호출 (로더로 분리)
-    start = time.perf_counter()
-    repos = load_search_results(
-        query=search_query,
+    cache_key = search_result_cache.build_cache_key(
+        question=question,
+        languages=languages,
         sort=sort.value,
         order=order.value,
         per_page=per_page,
     )
-    elapsed = time.perf_counter() - start
-    logger.info(f"검색 API 실행 시간: {elapsed:.4f}초")
-
-    # 3. 요약 입력 DTO + 보조 데이터 준비
-    summary_dtos, languages_per_repo, html_urls, names, stargazers_list = await _build_summary_dtos_and_aux(repos)
-
-    # 4. LLM 한 번 호출해서 요약 리스트 얻기
-    start = time.perf_counter()
-    summaries = await _summarize_repositories_parallel_async(summary_dtos) # 병렬 테스트
-    elapsed = time.perf_counter() - start
-    logger.info(f"리포지토리 요약 실행 시간: {elapsed:.4f}초")
-
-    # 5. 최종 응답 DTO로 조립
-    return _build_search_results(
-        names=names,
-        languages_per_repo=languages_per_repo,
-        stargazers_list=stargazers_list,
-        html_urls=html_urls,
-        summaries=summaries,
+    return _stream_search_events(cache_key, question, languages, sort, order, per_page)
+
+
+async def _stream_search_events(
+    cache_key: str,
+    question: str,
+    languages: list[str],
+    sort: SortBy,
+    order: OrderBy,
+    per_page: int,
+) -> AsyncIterator[SearchStreamEvent]:
+    # 캐시에 있으면 완성된 결과를 한 번에 보낸다
+    cached = await search_result_cache.aget_cached(cache_key)
+    if cached is not None:
+        yield SearchStreamEvent(type="repositories", results=cached)
+        yield SearchStreamEvent(type="done")
+        return
+
+    # 이 검색의 LLM 호출은 하나의 공정 큐 단위로 묶는다
+    llm_governor.new_request_key()
+
+    pipelines: list[_RepositoryPipeline] = []
+    try:
+        repos = await _asearch_repositories(question, languages, sort, order, per_page)
+        pipelines = _start_repository_pipelines(repos)
+        # 요약은 이미 리포지토리별로 진행 중이고, 뼈대 전송을 위해 언어 조회만 기다린다
+        await asyncio.gather(*(pipeline.languages for pipeline in pipelines))
+    except Exception as e:
+        # 스트림이 시작된 뒤에는 상태 코드를 바꿀 수 없으므로 오류 이벤트로 알린다
+        logger.error(f"스트리밍 검색 실패: {e}")
+        _cancel_pipelines(pipelines)
+        yield SearchStreamEvent(type="error", detail="검색 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
+        return
+
+    # 요약 없는 뼈대 먼저 전송
+    yield SearchStreamEvent(
+        type="repositories",
+        results=[pipeline.build_result(summary=[]) for pipeline in pipelines],
     )
 
+    async def wait_summary(index: int) -> tuple[int, list[str] | None]:
+        try:
+            return index, await pipelines[index].summary
+        except Exception as e:
+            logger.error(f"리포지토리 요약 실패 ({pipelines[index].repo['full_name']}): {e}")
+            return index, None
+
+    summaries: list[list[str] | None] = [None] * len(pipelines)
+    try:
+        # 끝나는 순서대로 요약 전송
+        for next_done in asyncio.as_completed([wait_summary(i) for i in range(len(pipelines))]):
+            index, summary = await next_done
+            if summary is None:
+                yield SearchStreamEvent(type="error", index=index, detail="리포지토리 요약 중 오류가 발생했습니다.")
+                continue
+            summaries[index] = summary
+            yield SearchStreamEvent(type="summary", index=index, function_summary=summary)
+    finally:
+        # 클라이언트 연결이 끊긴 경우 남은 요약 작업 취소
+        _cancel_pipelines(pipelines)
+
+    yield SearchStreamEvent(type="done")
+
+    # 모든 요약이 성공했다면 일반 검색과 같은 캐시에 저장
+    if all(summary is not None for summary in summaries):
+        await search_result_cache.astore(
+            cache_key,
+            [pipeline.build_result(summary) for pipeline, summary in zip(pipelines, summaries)],
+        )
+
+
+async def _search_uncached(
+    question: str,
+    languages: list[str],
+    sort: SortBy,
+    order: OrderBy,
+    per_page: int,
+) -> list[RepoSearchResp]:
+    """캐시를 거치지 않고 전체 검색 파이프라인을 실행한다."""
+    # 이 검색의 LLM 호출은 하나의 공정 큐 단위로 묶는다
+    llm_governor.new_request_key()
+
+    # 1~2. Search Query 생성 + 검색 API 호출
+    repos = await _asearch_repositories(question, languages, sort, order, per_page)
+
+    # 3~4. 리포지토리별 파이프라인: 언어 조회가 끝난 리포지토리부터 바로 요약 시작
+    #      (요약 캐시에 있는 리포지토리는 LLM 호출 생략)
+    with stage("repository_pipelines"):
+        pipelines = _start_repository_pipelines(repos)
+        try:
+            # 5. 최종 응답 DTO로 조립 (검색 결과 순서 유지)
+            results = await asyncio.gather(*(pipeline.aresult() for pipeline in pipelines))
+        except Exception:
+            _cancel_pipelines(pipelines)
+            raise
+
+    return list(results)
 
-async def _build_summary_dtos_and_aux(
-    repos: list[dict],
-) -> tuple[list[RepositorySummaryDTO], list[list[LanguageRatio]], list[HttpUrl], list[str], list[int]]:
-    """
-    - LLM 요약 입력용 GithubRepositorySummaryDTO 리스트
-    - 최종 응답 조립에 필요한 보조 데이터들
-    을 한 번에 만든다.
 
-    asyncio.to_thread 를 사용해 병렬로 처리하여 전체 응답 시간을 줄인다.
+async def _asearch_repositories(
+    question: str,
+    languages: list[str],
+    sort: SortBy,
+    order: OrderBy,
+    per_page: int,
+) -> list[dict]:
+    """Search Query 생성 후 GitHub 검색 API를 호출한다."""
+
+    # 1. Search Query 생성
+    with stage("search_query"):
+        search_query = await _abuild_search_query(question=question, languages=languages)
+    logger.info(f"생성된 Search Query: {search_query}")
+
+    # 2. 검색 API 호출 (로더로 분리)
+    with stage("github_search"):
+        repos = await aload_search_results(
+            query=search_query,
+            sort=sort.value,
+            order=order.value,
+            per_page=per_page,
+        )
+    return repos
+
+
+@dataclass
+class _RepositoryPipeline:
+    """리포지토리 하나에 대한 언어 조회 -> 요약 파이프라인"""
+    repo: dict
+    languages: asyncio.Task[list[LanguageRatio]]
+    summary: asyncio.Task[list[str]]
+    batcher: SummaryBatcher | None = None
+
+    def build_result(self, summary: list[str]) -> RepoSearchResp:
+        """언어 조회가 끝난 뒤 호출. 원본 데이터와 요약을 조합해 응답 DTO를 만든다."""
+        return RepoSearchResp(
+            name=self.repo["name"],
+            function_summary=summary,
+            languages=self.languages.result(),
+            stargazers_count=self.repo["stargazers_count"],
+            html_url=self.repo["html_url"],
+        )
+
+    async def aresult(self) -> RepoSearchResp:
+        summary = await self.summary
+        return self.build_result(summary)
+
+    def cancel(self) -> None:
+        self.languages.cancel()
+        self.summary.cancel()
+        if self.batcher is not None:
+            self.batcher.cancel()
+
+
+def _start_repository_pipelines(repos: list[dict]) -> list[_RepositoryPipeline]:
+    """
+    리포지토리마다 언어 조회 -> 요약 파이프라인을 시작한다.
+    단계 사이에 전체 대기(barrier)가 없으므로 언어 조회가 먼저 끝난 리포지토리부터 요약이 시작된다.
+    요청 하나에서 동시에 실행되는 외부 호출 수는 PIPELINE_CONCURRENCY로 제한한다.
+    batched 모드에서는 언어 조회가 끝난 리포지토리를 모아(micro-batching) 한 번의 LLM 호출로 요약한다.
     """
-    summary_dtos: list[RepositorySummaryDTO] = []
-    languages_per_repo: list[list[LanguageRatio]] = []
-    html_urls: list[HttpUrl] = []
-    names: list[str] = []
-    stargazers_list: list[int] = []
-
-    async def build_one(repo: dict):
-        # 언어 조회 API 호출은 동기 함수(load_repository_languages)를
-        # 별도 스레드에서 실행하여 병렬화한다.
-        lang_bytes = await asyncio.to_thread(
-            load_repository_languages,
-            repo["languages_url"],
+    semaphore = asyncio.Semaphore(PIPELINE_CONCURRENCY)
+    chain = resources.get_summary_chain()
+    batcher = SummaryBatcher(chain, expected=len(repos)) if _choose_summary_mode(len(repos)) == "batched" else None
+
+    async def load_languages(load: Callable[[], Awaitable[dict[str, int]]]) -> list[LanguageRatio]:
+        async with semaphore:
+            with stage("languages", log=False):
+                lang_bytes = await load()
+        return _convert_lang_bytes_to_ratios(lang_bytes)
+
+    async def summarize(repo: dict, languages: asyncio.Task[list[LanguageRatio]]) -> list[str]:
+        dto = _build_summary_dto(repo, await languages)
+        async with semaphore:
+            with stage("summary", log=False):
+                return await summary_cache.aget_or_summarize(
+                    repo["full_name"],
+                    dto,
+                    lambda: chain.ainvoke(dto.model_dump()),
+                )
+
+    async def summarize_batched(repo: dict, languages: asyncio.Task[list[LanguageRatio]]) -> list[str]:
+        requested = False
+
+        def request_summary() -> Awaitable[list[str]]:
+            nonlocal requested
+            requested = True
+            return batcher.asummarize(dto.model_dump())
+
+        try:
+            dto = _build_summary_dto(repo, await languages)
+            # LLM 호출 수는 배치로 이미 줄어들므로 semaphore 없이 배치에 합류
+            with stage("summary", log=False):
+                return await summary_cache.aget_or_summarize(repo["full_name"], dto, request_summary)
+        finally:
+            # 캐시 적중/언어 조회 실패로 배치에 합류하지 않았다면 배치가 기다리지 않도록 알린다
+            if not requested:
+                batcher.skip()
+
+    pipelines: list[_RepositoryPipeline] = []
+    for repo, load in zip(repos, prepare_languages_loaders(repos)):
+        languages_task = asyncio.create_task(load_languages(load))
+        summary_task = asyncio.create_task(
+            summarize_batched(repo, languages_task) if batcher else summarize(repo, languages_task)
         )
-        languages = _convert_lang_bytes_to_ratios(lang_bytes)
-
-        dto = RepositorySummaryDTO(
-            name=repo["name"],
-            description=repo.get("description") or "",
-            languages=languages,
-            topics=repo.get("topics", []),
-            pushed_at=repo["pushed_at"],
+        pipelines.append(
+            _RepositoryPipeline(repo=repo, languages=languages_task, summary=summary_task, batcher=batcher)
         )
-        return dto, languages, repo["html_url"], repo["name"], repo["stargazers_count"]
 
-    # 모든 repo에 대한 작업을 동시에 실행
-    results = await asyncio.gather(*(build_one(repo) for repo in repos))
+    return pipelines
 
-    for dto, languages, html_url, name, stars in results:
-        summary_dtos.append(dto)
-        languages_per_repo.append(languages)
-        html_urls.append(html_url)
-        names.append(name)
-        stargazers_list.append(stars)
 
-    return summary_dtos, languages_per_repo, html_urls, names, stargazers_list
+def _build_summary_dto(repo: dict, languages: list[LanguageRatio]) -> RepositorySummaryDTO:
+    return RepositorySummaryDTO(
+        name=repo["name"],
+        description=repo.get("description") or "",
+        languages=languages,
+        topics=repo.get("topics", []),
+        pushed_at=repo["pushed_at"],
+    )
+
+
+def _choose_summary_mode(repo_count: int) -> str:
+    """
+    auto 모드에서는 LLM 거버너의 여유 자리가 요약할 리포지토리 수보다 많으면 fanout(지연 시간 우선),
+    부족하면 batched(요청 수/중복 프롬프트 토큰 절감)를 선택한다.
+    """
+    if SUMMARY_MODE in ("fanout", "batched"):
+        return SUMMARY_MODE
+    if repo_count < 2:
+        return "fanout"
+    return "fanout" if llm_governor.governor.free_slots() >= repo_count else "batched"
+
+
+def _cancel_pipelines(pipelines: list[_RepositoryPipeline]) -> None:
+    for pipeline in pipelines:
+        pipeline.cancel()
 
 
 def _convert_lang_bytes_to_ratios(lang_bytes: dict[str, int]) -> list[LanguageRatio]:
@@ -139,47 +357,7 @@ def _convert_lang_bytes_to_ratios(lang_bytes: dict[str, int]) -> list[LanguageRa
     return languages
 
 
-def _summarize_repositories(
-    summary_dtos: list[RepositorySummaryDTO],
-) -> list[list[str]]:
-    """LLM 체인을 한 번만 호출해 각 리포지토리의 3줄 요약을 반환."""
-    summary_chain = SimpleGithubRepositorySummaryChain()
-    metadata_list = [dto.model_dump() for dto in summary_dtos]
-    summaries: list[list[str]] = summary_chain.invoke(metadata_list)
-    return summaries
-
-async def _summarize_repositories_parallel_async(summary_dtos):
-    """병렬 실행용 함수"""
-
-    chain = SimpleGithubRepositorySummaryChain()
-    async def one(dto):
-        return await chain.ainvoke(dto.model_dump())
-
-    return await asyncio.gather(*(one(dto) for dto in summary_dtos))
-
-def _build_search_results(
-    names: list[str],
-    languages_per_repo: list[list[LanguageRatio]],
-    stargazers_list: list[int],
-    html_urls: list[HttpUrl],
-    summaries: list[list[str]],
-) -> list[RepoSearchResp]:
-    """LLM 요약 결과와 원본 데이터를 조합해 최종 DTO 리스트를 만든다."""
-    search_results: list[RepoSearchResp] = []
-
-    for name, langs, stars, url, summary in zip(
-        names, languages_per_repo, stargazers_list, html_urls, summaries
-    ):
-        result = RepoSearchResp(
-            name=name,
-            function_summary=summary,
-            languages=langs,
-            stargazers_count=stars,
-            html_url=url,
-        )
-        search_results.append(result)
-
-    return search_results
-
-def _build_search_query(question: str, languages: list[str]):
-    return _query_chain.invoke(question=question, languages=languages)
\ No newline at end of file
+async def _abuild_search_query(question: str, languages: list[str]):
+    # 쿼리 체인은 lifespan에서 백그라운드로 한 번만 생성된 공유 객체
+    query_chain = await resources.aget_query_chain()
+    return await query_chain.ainvoke(question=question, languages=languages)
\ No newline at end of file
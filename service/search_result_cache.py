@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from fastapi.logger import logger
+
+from common.config.redis_client import get_async_redis_client
+from schema.repo_search_resp import RepoSearchResp
+
+# ---- 검색 결과 캐시 설정 (환경변수로 조정 가능) ----
+CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+FRESH_TTL: int = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "3600"))  # 이 시간 동안은 그대로 응답
+STALE_TTL: int = int(os.getenv("SEARCH_CACHE_STALE_TTL_SECONDS", "86400"))  # 이후 이 시간 동안은 응답 + 백그라운드 갱신
+REFRESH_LOCK_TTL: int = 120  # 백그라운드 갱신 중복 방지 락 TTL
+KEY_PREFIX = "search_result:"
+
+# 캐시 상태: HIT / STALE / MISS / BYPASS (응답 헤더 X-Cache 로 노출)
+search_cache_status: ContextVar[str] = ContextVar("search_cache_status", default="BYPASS")
+
+# 백그라운드 갱신 태스크가 GC 되지 않도록 참조 유지
+_background_tasks: set[asyncio.Task] = set()
+
+
+@dataclass
+class SearchCacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+stats = SearchCacheStats()
+
+
+def build_cache_key(
+    question: str,
+    languages: list[str],
+    sort: str,
+    order: str,
+    per_page: int,
+) -> str:
+    """정규화된 검색 조건으로 캐시 키를 만든다. (공백/대소문자/언어 순서 무시)"""
+    normalized_question = " ".join(question.lower().split())
+    normalized_languages = sorted({lang.lower() for lang in languages})
+    payload = json.dumps(
+        [normalized_question, normalized_languages, sort, order, per_page],
+        ensure_ascii=False,
+    )
+    return KEY_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def aget_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[list[RepoSearchResp]]],
+) -> list[RepoSearchResp]:
+    """
+    캐시에 있으면 바로 반환하고, 없으면 compute()로 계산한다.
+    - FRESH_TTL 이내: 그대로 반환 (HIT)
+    - FRESH_TTL 경과: 기존 값을 반환하고 백그라운드에서 갱신 (STALE)
+    - 없음: 계산 (MISS)
+    저장은 compute()가 astore()로 한다. (single-flight로 합쳐진 요청마다 같은 값을 다시 쓰지 않도록 계산한 쪽에서만 저장)
+    Redis 장애 시에는 캐시 없이 계산한다.
+    """
+    if not CACHE_ENABLED:
+        search_cache_status.set("BYPASS")
+        return await compute()
+
+    cached = await _aread(key)
+    if cached is not None:
+        cached_at, results = cached
+        age = time.time() - cached_at
+        if age < FRESH_TTL:
+            stats.hits += 1
+            search_cache_status.set("HIT")
+            logger.info(f"검색 결과 캐시 HIT (age={age:.0f}s, hit_rate={stats.hit_rate():.2%})")
+            return results
+
+        stats.stale_hits += 1
+        search_cache_status.set("STALE")
+        logger.info(f"검색 결과 캐시 STALE (age={age:.0f}s), 백그라운드 갱신 예약")
+        _schedule_refresh(key, compute)
+        return results
+
+    stats.misses += 1
+    search_cache_status.set("MISS")
+    logger.info(f"검색 결과 캐시 MISS (hit_rate={stats.hit_rate():.2%})")
+
+    return await compute()
+
+
+async def aget_cached(key: str) -> list[RepoSearchResp] | None:
+    """
+    계산 없이 캐시만 조회한다. (스트리밍 검색용)
+    TTL이 지난 값은 갱신할 계산 함수가 없으므로 MISS로 취급한다.
+    """
+    if not CACHE_ENABLED:
+        search_cache_status.set("BYPASS")
+        return None
+
+    cached = await _aread(key)
+    if cached is not None and time.time() - cached[0] < FRESH_TTL:
+        stats.hits += 1
+        search_cache_status.set("HIT")
+        return cached[1]
+
+    stats.misses += 1
+    search_cache_status.set("MISS")
+    return None
+
+
+async def astore(key: str, results: list[RepoSearchResp]) -> None:
+    """계산한 결과를 캐시에 저장한다. (aget_or_compute의 compute, 스트리밍 검색 등)"""
+    if CACHE_ENABLED:
+        await _awrite(key, results)
+
+
+async def _aread(key: str) -> tuple[float, list[RepoSearchResp]] | None:
+    try:
+        raw = await get_async_redis_client().get(key)
+        if raw is None:
+            return None
+        payload = json.loads(raw)
+        results = [RepoSearchResp.model_validate(item) for item in payload["results"]]
+        return payload["cached_at"], results
+    except Exception as e:
+        stats.errors += 1
+        logger.error(f"검색 결과 캐시 조회 실패: {e}")
+        return None
+
+
+async def _awrite(key: str, results: list[RepoSearchResp]) -> None:
+    # 빈 결과는 잘못 생성된 쿼리일 가능성이 있어 캐시하지 않는다
+    if not results:
+        return
+
+    payload = {
+        "cached_at": time.time(),
+        "results": [result.model_dump(mode="json") for result in results],
+    }
+    try:
+        await get_async_redis_client().set(
+            key,
+            json.dumps(payload, ensure_ascii=False),
+            ex=FRESH_TTL + STALE_TTL,
+        )
+    except Exception as e:
+        stats.errors += 1
+        logger.error(f"검색 결과 캐시 저장 실패: {e}")
+
+
+def _schedule_refresh(key: str, compute: Callable[[], Awaitable[list[RepoSearchResp]]]) -> None:
+    task = asyncio.create_task(_arefresh(key, compute))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _arefresh(key: str, compute: Callable[[], Awaitable[list[RepoSearchResp]]]) -> None:
+    lock_key = f"{key}:refresh"
+    redis_client = get_async_redis_client()
+    try:
+        # 여러 워커가 같은 키를 동시에 갱신하지 않도록 락 획득
+        if not await redis_client.set(lock_key, 1, nx=True, ex=REFRESH_LOCK_TTL):
+            return
+    except Exception as e:
+        stats.errors += 1
+        logger.error(f"검색 결과 캐시 갱신 락 획득 실패: {e}")
+        return
+
+    try:
+        await compute()  # compute()가 저장까지 한다
+        logger.info("검색 결과 캐시 백그라운드 갱신 완료")
+    except Exception as e:
+        logger.error(f"검색 결과 캐시 백그라운드 갱신 실패: {e}")
+    finally:
+        try:
+            await redis_client.delete(lock_key)
+        except Exception:
+            pass
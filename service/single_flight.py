@@ -0,0 +1,214 @@
+import asyncio
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from fastapi.logger import logger
+
+from common.config.redis_client import get_async_redis_client
+from common.exceptions import SingleFlightLeaderError
+
+T = TypeVar("T")
+
+# ---- single-flight 설정 (환경변수로 조정 가능) ----
+# true면 Redis 락 + pub/sub으로 여러 워커 간에도 동일 요청을 하나로 합친다
+DISTRIBUTED: bool = os.getenv("SINGLE_FLIGHT_DISTRIBUTED", "false").lower() == "true"
+LOCK_TTL: int = int(os.getenv("SINGLE_FLIGHT_LOCK_TTL_SECONDS", "60"))  # 리더가 죽어도 락이 풀리는 시간
+WAIT_TIMEOUT: float = float(os.getenv("SINGLE_FLIGHT_WAIT_TIMEOUT_SECONDS", "60"))  # 다른 워커 결과 대기 한도
+LOCK_PREFIX = "single_flight:lock:"
+CHANNEL_PREFIX = "single_flight:result:"
+RESULT_PREFIX = "single_flight:value:"
+RESULT_TTL = 10  # 발행 직후 구독한 워커가 결과를 읽어갈 수 있도록 잠시 보관
+ERROR_PREFIX = b"__error__:"  # 리더 실패 시 발행하는 메시지 (뒤에 오류 내용)
+RETRY_MESSAGE = b"__retry__"  # 리더가 취소되어 결과가 없을 때 (구독자는 락을 다시 다툰다)
+MAX_ATTEMPTS = 3  # 리더가 결과 없이 사라졌을 때 락을 다시 다투는 횟수
+
+# 릴리스 시 자신이 잡은 락만 삭제
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 보관된 결과와 락 존재 여부를 한 번에 확인 (두 번 왕복하는 사이 리더가 끝나는 경쟁 방지)
+_CHECK_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    return {1, value}
+end
+return {0, redis.call('EXISTS', KEYS[2])}
+"""
+
+# _await_leader 결과: 기다릴 리더가 없음 (락을 다시 다툰다)
+_NO_LEADER = object()
+
+
+@dataclass
+class SingleFlightStats:
+    executions: int = 0  # 실제로 계산을 실행한 횟수
+    local_coalesced: int = 0  # 같은 프로세스의 진행 중인 계산에 합류한 횟수
+    remote_coalesced: int = 0  # 다른 워커의 계산 결과를 받아 쓴 횟수
+    fallbacks: int = 0  # 다른 워커 결과를 못 받아 직접 계산한 횟수
+
+
+stats = SingleFlightStats()
+
+# 진행 중인 계산 (key -> 공유 태스크)
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def ado(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    encode: Callable[[T], bytes],
+    decode: Callable[[bytes], T],
+) -> T:
+    """
+    같은 key의 계산이 이미 진행 중이면 새로 실행하지 않고 그 결과를 함께 기다린다.
+    계산은 별도 태스크로 실행되므로, 처음 요청한 클라이언트가 연결을 끊어도 나머지 요청은 영향받지 않는다.
+    encode/decode는 워커 간 결과 전달(pub/sub)에 사용한다.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        runner = _arun_distributed(key, compute, encode, decode) if DISTRIBUTED else _arun_local(compute)
+        task = asyncio.create_task(runner)
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        stats.local_coalesced += 1
+
+    return await asyncio.shield(task)
+
+
+async def _arun_local(compute: Callable[[], Awaitable[T]]) -> T:
+    stats.executions += 1
+    return await compute()
+
+
+async def _arun_distributed(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    encode: Callable[[T], bytes],
+    decode: Callable[[bytes], T],
+) -> T:
+    """
+    Redis 락을 잡은 워커(리더)만 계산하고 결과를 채널로 발행한다.
+    나머지 워커는 채널을 구독해 결과를 받고, 리더가 실패하면 같은 오류(SingleFlightLeaderError)로 끝낸다.
+    (장애 중에 모든 워커가 동시에 재시도하지 않도록)
+    리더가 결과 없이 사라졌으면 락을 다시 다투고, Redis 장애/타임아웃 시에는 직접 계산한다.
+    """
+    redis_client = get_async_redis_client()
+    lock_key = LOCK_PREFIX + key
+    channel = CHANNEL_PREFIX + key
+    result_key = RESULT_PREFIX + key
+    token = uuid.uuid4().hex
+
+    for _ in range(MAX_ATTEMPTS):
+        try:
+            acquired = await redis_client.set(lock_key, token, nx=True, ex=LOCK_TTL)
+        except Exception as e:
+            logger.error(f"single-flight 락 획득 실패, 직접 계산: {e}")
+            return await _arun_local(compute)
+
+        if acquired:
+            return await _arun_leader(compute, encode, lock_key, channel, result_key, token)
+
+        result = await _await_leader(channel, lock_key, result_key, decode)
+        if result is _NO_LEADER:
+            continue
+        if result is not None:
+            stats.remote_coalesced += 1
+            return result
+        break
+
+    stats.fallbacks += 1
+    return await _arun_local(compute)
+
+
+async def _arun_leader(
+    compute: Callable[[], Awaitable[T]],
+    encode: Callable[[T], bytes],
+    lock_key: str,
+    channel: str,
+    result_key: str,
+    token: str,
+) -> T:
+    """
+    결과를 잠시 보관(result_key) -> 락 해제 -> 발행 순서로 알린다.
+    발행 이후에 구독한 워커도 락이 남아 있는 동안에는 보관된 결과를 읽을 수 있어, 타임아웃까지 기다리지 않는다.
+    실패하면 오류 내용을, 취소되면 다시 다투라는 신호를 같은 방식으로 알린다.
+    """
+    redis_client = get_async_redis_client()
+    message = RETRY_MESSAGE
+    try:
+        # 이전 계산이 남긴 결과를 새 구독자가 읽지 않도록 지운다
+        await redis_client.delete(result_key)
+    except Exception as e:
+        logger.error(f"single-flight 이전 결과 삭제 실패: {e}")
+
+    try:
+        result = await _arun_local(compute)
+        message = encode(result)
+        return result
+    except Exception as e:
+        message = ERROR_PREFIX + str(e).encode("utf-8")
+        raise
+    finally:
+        try:
+            await redis_client.set(result_key, message, ex=RESULT_TTL)
+            await redis_client.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+            await redis_client.publish(channel, message)
+        except Exception as e:
+            logger.error(f"single-flight 결과 발행 실패: {e}")
+
+
+async def _await_leader(channel: str, lock_key: str, result_key: str, decode: Callable[[bytes], T]) -> T | object | None:
+    """
+    리더의 결과를 기다린다.
+    리더가 없으면 _NO_LEADER, 결과를 받지 못하면(타임아웃/Redis 장애) None, 리더가 실패했으면 SingleFlightLeaderError.
+    """
+    redis_client = get_async_redis_client()
+    pubsub = redis_client.pubsub()
+    try:
+        await pubsub.subscribe(channel)
+
+        # 구독 전에 리더가 이미 끝났다면 메시지를 받을 수 없으므로 보관된 결과와 락을 확인
+        found, value = await redis_client.eval(_CHECK_SCRIPT, 2, result_key, lock_key)
+        if not found:
+            if not value:
+                return _NO_LEADER
+            value = None
+            async with asyncio.timeout(WAIT_TIMEOUT):
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        value = message["data"]
+                        break
+            if value is None:
+                return None
+
+        if value == RETRY_MESSAGE:
+            return _NO_LEADER
+        return _decode_message(value, decode)
+    except SingleFlightLeaderError:
+        raise
+    except Exception as e:
+        # TimeoutError 포함
+        logger.error(f"single-flight 결과 대기 실패, 직접 계산: {e!r}")
+    finally:
+        try:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+        except Exception:
+            pass
+
+    return None
+
+
+def _decode_message(data: bytes, decode: Callable[[bytes], T]) -> T:
+    if data.startswith(ERROR_PREFIX):
+        raise SingleFlightLeaderError(
+            f"다른 워커에서 처리 중이던 같은 요청이 실패했습니다: {data[len(ERROR_PREFIX):].decode('utf-8', 'replace')}"
+        )
+    return decode(data)
@@ -0,0 +1,97 @@
+import asyncio
+import os
+
+from fastapi.logger import logger
+
+from langchain.chain.simple_github_repository_summary_chain import SimpleGithubRepositorySummaryChain
+
+# ---- 요약 micro-batching 설정 (환경변수로 조정 가능) ----
+BATCH_SIZE: int = int(os.getenv("SUMMARY_BATCH_SIZE", "5"))  # LLM 호출 한 번에 요약할 최대 리포지토리 수
+BATCH_WINDOW: float = int(os.getenv("SUMMARY_BATCH_WINDOW_MS", "50")) / 1000  # 배치를 모으는 최대 대기 시간
+
+
+class SummaryBatcher:
+    """
+    검색 요청 하나의 리포지토리 요약을 모아 한 번의 LLM 호출(abatch_invoke)로 처리한다.
+    - 언어 조회가 끝나는 대로 asummarize()로 들어온 요청을 모으고,
+      batch_size개가 모이거나 expected개가 모두 들어오거나 window가 지나면 보낸다.
+    - 배치 응답의 요약 개수가 맞지 않으면 그 배치만 리포지토리별 호출(ainvoke)로 다시 요약한다.
+    """
+
+    def __init__(
+        self,
+        chain: SimpleGithubRepositorySummaryChain,
+        expected: int,
+        batch_size: int = BATCH_SIZE,
+        window: float = BATCH_WINDOW,
+    ):
+        self._chain = chain
+        self._remaining = expected  # 아직 들어오지 않은 요약 요청 수 (요약 캐시 적중분은 skip()으로 차감)
+        self._batch_size = max(1, batch_size)
+        self._window = window
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def asummarize(self, metadata: dict) -> list[str]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((metadata, future))
+        self._remaining -= 1
+
+        if len(self._pending) >= self._batch_size or self._remaining <= 0:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._flush)
+
+        return await future
+
+    def skip(self) -> None:
+        """요약 캐시 적중 등으로 asummarize()를 호출하지 않는 리포지토리를 알린다."""
+        self._remaining -= 1
+        if self._remaining <= 0 and self._pending:
+            self._flush()
+
+    def cancel(self) -> None:
+        """클라이언트 연결이 끊긴 경우 등 진행 중인 배치 호출을 취소한다."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+        for task in self._tasks:
+            task.cancel()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._arun(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _arun(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        metadata_list = [metadata for metadata, _ in batch]
+        try:
+            try:
+                summaries = await self._chain.abatch_invoke(metadata_list)
+            except ValueError as e:
+                logger.warning(f"배치 요약 결과 불일치, 리포지토리별 요약으로 대체: {e}")
+                summaries = await asyncio.gather(*(self._chain.ainvoke(metadata) for metadata in metadata_list))
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), summary in zip(batch, summaries):
+            if not future.done():
+                future.set_result(summary)
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from fastapi.logger import logger
+
+from common.config.redis_client import get_async_redis_client
+from schema.repo_summary_dto import RepositorySummaryDTO
+
+# ---- 리포지토리 요약 캐시 설정 (환경변수로 조정 가능) ----
+CACHE_ENABLED: bool = os.getenv("SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+CACHE_TTL: int = int(os.getenv("SUMMARY_CACHE_TTL_SECONDS", str(60 * 60 * 24 * 7)))  # 7일
+LOCAL_CACHE_SIZE: int = int(os.getenv("SUMMARY_LOCAL_CACHE_SIZE", "1024"))
+KEY_PREFIX = "repo_summary:"
+
+
+@dataclass
+class SummaryCacheStats:
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+
+stats = SummaryCacheStats()
+
+
+class _LRUCache:
+    """프로세스 내부 LRU 캐시 (Redis 앞단)"""
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._data: OrderedDict[str, list[str]] = OrderedDict()
+
+    def get(self, key: str) -> list[str] | None:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: list[str]) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+
+_local_cache = _LRUCache(LOCAL_CACHE_SIZE)
+
+
+def build_cache_key(full_name: str, dto: RepositorySummaryDTO) -> str:
+    """
+    리포지토리 전체 이름 + 요약 입력 DTO 해시로 키를 만든다.
+    설명/토픽/언어/pushed_at 중 하나라도 바뀌면 키가 달라져 요약을 다시 생성한다.
+    """
+    fingerprint = hashlib.sha256(dto.model_dump_json().encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}{full_name.lower()}:{fingerprint}"
+
+
+async def aget_or_summarize(
+    full_name: str,
+    dto: RepositorySummaryDTO,
+    summarize: Callable[[], Awaitable[list[str]]],
+) -> list[str]:
+    """로컬 LRU -> Redis -> LLM 순서로 요약을 찾는다."""
+    if not CACHE_ENABLED:
+        return await summarize()
+
+    key = build_cache_key(full_name, dto)
+
+    cached = _local_cache.get(key)
+    if cached is not None:
+        stats.local_hits += 1
+        return cached
+
+    cached = await _aread(key)
+    if cached is not None:
+        stats.redis_hits += 1
+        _local_cache.put(key, cached)
+        return cached
+
+    stats.misses += 1
+    summary = await summarize()
+    _local_cache.put(key, summary)
+    await _awrite(key, summary)
+    return summary
+
+
+async def _aread(key: str) -> list[str] | None:
+    try:
+        raw = await get_async_redis_client().get(key)
+        return json.loads(raw) if raw is not None else None
+    except Exception as e:
+        stats.errors += 1
+        logger.error(f"요약 캐시 조회 실패: {e}")
+        return None
+
+
+async def _awrite(key: str, summary: list[str]) -> None:
+    try:
+        await get_async_redis_client().set(key, json.dumps(summary, ensure_ascii=False), ex=CACHE_TTL)
+    except Exception as e:
+        stats.errors += 1
+        logger.error(f"요약 캐시 저장 실패: {e}")